@@ -0,0 +1,5 @@
+"""Multi-asset fusion engine driving every FUSION_RUNTIME asset from one process."""
+
+from .assets import ASSETS
+from .engine import fusion_cycle, recover
+from .scheduler import CycleScheduler, continuous_runtime
@@ -0,0 +1,53 @@
+# =========================================================
+# python -m fusion_engine [ASSET ...]
+# =========================================================
+
+import argparse, json
+
+from . import config, store
+from .assets import ASSETS
+from .engine import fusion_cycle
+from .scheduler import CATCHUP_POLICIES, CycleScheduler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="fusion_engine", description="Multi-asset fusion runtime")
+    parser.add_argument("assets", nargs="*", help=f"assets to run (default: all of {', '.join(ASSETS)})")
+    parser.add_argument("--once", action="store_true", help="run a single cycle and exit")
+    parser.add_argument("--interval", help="cycle cadence, e.g. 4h, 15m, 1h30m (default: %(default)s)",
+                        default=config.CYCLE_INTERVAL)
+    parser.add_argument("--offset", help="shift boundaries past UTC multiples, e.g. 5m", default=config.CYCLE_OFFSET)
+    parser.add_argument("--jitter", type=float, default=config.CYCLE_JITTER_SECONDS,
+                        help="max random start delay in seconds (nominal cycle time is unchanged)")
+    parser.add_argument("--catchup", choices=CATCHUP_POLICIES, default=config.CYCLE_CATCHUP,
+                        help="what to do with cycles missed while the process was down or busy")
+    parser.add_argument("--wait", action="store_true", help="wait for the next boundary instead of running now")
+    parser.add_argument("--compact", action="store_true",
+                        help="fold legacy TOTAL_RECALL_RUNTIME_*.json files into the store and exit")
+    parser.add_argument("--remove-legacy", action="store_true", help="with --compact, delete the folded files")
+    parser.add_argument("--query", metavar="COLUMN",
+                        help='print one stored column as JSON lines and exit, e.g. "M6.risk_chain_score"')
+    parser.add_argument("--days", type=float, help="with --query, only the last N days")
+    args = parser.parse_args(argv)
+    unknown = [a for a in args.assets if a not in ASSETS]
+    if unknown:
+        parser.error(f"unknown assets: {', '.join(unknown)}")
+    assets = args.assets or None
+    if args.compact:
+        for asset in args.assets or ASSETS:
+            store.compact(asset, remove=args.remove_legacy)
+        return
+    if args.query:
+        for asset in args.assets or ASSETS:
+            for cycle_utc, value in store.series(asset, args.query, days=args.days):
+                print(json.dumps({"asset": asset, "cycle_utc": cycle_utc, args.query: value}, ensure_ascii=False))
+        return
+    if args.once:
+        fusion_cycle(assets)
+        return
+    scheduler = CycleScheduler(assets, interval=args.interval, offset=args.offset,
+                               jitter=args.jitter, catchup=args.catchup)
+    scheduler.run_forever(immediate=not args.wait)
+
+if __name__ == "__main__":
+    main()
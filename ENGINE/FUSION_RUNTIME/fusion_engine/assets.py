@@ -0,0 +1,295 @@
+# =========================================================
+# fusion_engine/assets.py
+# =========================================================
+# ✅ Per-asset spec table (symbols, fallbacks, M1–M7 weights)
+# ✅ Generic M1–M7 modules driven by the spec
+# =========================================================
+
+import operator
+
+# ==============================
+# 🌐 SHARED SOURCES
+# ==============================
+# A source is a (provider, symbol) pair; an input is a fallback chain of
+# sources tried in order until one returns a value.
+DXY_TD = ("twelvedata", "DXY")
+DXY_YH = ("yahoo", "DX-Y.NYB")
+VIX_TD = ("twelvedata", "VIX")
+VIX_YH = ("yahoo", "^VIX")
+GOLD_YH = ("yahoo", "GC=F")
+DGS10 = ("fred", "DGS10")
+BTC_CG = ("coingecko", "bitcoin")
+ETH_CG = ("coingecko", "ethereum")
+FEAR_GREED = ("feargreed", None)
+
+# ==============================
+# 📋 ASSET SPECS
+# ==============================
+# m1 / m2        — output key -> fallback chain (keys starting with "_" feed
+#                  the macro tone but are not written to the module output)
+# macro_tone     — [(required keys, score), ...] first match wins, else default;
+#                  "fraction" scores the share of m1 inputs present
+# scenario       — [(bias, tone op, tone, polarity op, polarity), ...] else neutral
+# confidence     — ("polarity", base, k) → base + |0.5 - polarity| * k
+#                  ("tone", base, d)     → base + tone / d
+# cross          — (output key, numerator, denominator, scale)
+# risk           — (polarity mode, divisor); "inverse" uses 1 - polarity
+ASSETS = {
+    "BTCUSD": {
+        "m1": {"BTC": [BTC_CG], "ETH": [ETH_CG], "DXY": [DXY_YH], "VIX": [VIX_YH]},
+        "m2": {"finnhub_sentiment": [("finnhub", "BTC-USD")]},
+        "macro_tone": [(("BTC", "DXY", "VIX"), 0.5)], "macro_tone_default": 0.25,
+        "scenario": [("bullish", ">", 0.45, ">", 0.55)],
+        "confidence": ("tone", 0.65, 2),
+        "mtf": {"alignment_score": 0.34, "phase": "transitional"},
+        "cross": ("BTC_ETH_corr", "BTC", "ETH", 0.001 / 20),
+        "risk": ("direct", 8),
+        "vol_multiplier": 2.5,
+        "integrity": ("BTC", "ETH", "DXY", "VIX"),
+    },
+    "DXY": {
+        "m1": {"DXY": [DXY_TD, DXY_YH], "yield_10y": [DGS10], "VIX": [VIX_YH], "XAUUSD": [GOLD_YH]},
+        "m2": {"BTC": [BTC_CG]},
+        "macro_tone": [(("DXY", "yield_10y", "XAUUSD"), 0.7)], "macro_tone_default": 0.4,
+        "scenario": [("bullish_usd", ">", 0.6, "<", 0.45), ("weakening_usd", "<", 0.5, ">", 0.55)],
+        "confidence": ("polarity", 0.65, 0.6),
+        "mtf": {"alignment_score": 0.31, "phase": "rotation"},
+        "cross": ("DXY_XAU_corr", "DXY", "XAUUSD", 0.001),
+        "risk": ("inverse", 8),
+        "vol_multiplier": 2.3,
+        "integrity": ("DXY", "yield_10y", "XAUUSD", "BTC"),
+    },
+    "ETHUSD": {
+        "m1": {"ETH": [("twelvedata", "ETH/USD")], "BTC": [BTC_CG], "_ETH_CG": [ETH_CG]},
+        "m2": {"btc_ref": [BTC_CG]},
+        "macro_tone": [(("ETH", "BTC", "_ETH_CG"), 0.7)], "macro_tone_default": 0.4,
+        "scenario": [("bullish", ">", 0.55, ">", 0.55), ("bearish", "<", 0.45, "<", 0.45)],
+        "confidence": ("polarity", 0.65, 0.6),
+        "mtf": {"alignment_score": 0.29, "phase": "transition"},
+        "cross": ("ETH_BTC_corr", "ETH", "BTC", 0.002),
+        "risk": ("inverse", 7),
+        "vol_multiplier": 3.1,
+        "integrity": ("ETH", "BTC"),
+    },
+    "EURUSD": {
+        "m1": {"EURUSD": [("twelvedata", "EUR/USD"), ("yahoo", "EURUSD=X")], "DXY": [DXY_TD],
+               "US10Y": [DGS10], "BTC": [BTC_CG]},
+        "m2": {},
+        "macro_tone": [(("EURUSD", "DXY", "US10Y"), 0.6)], "macro_tone_default": 0.4,
+        "scenario": [("bullish_eur", ">", 0.55, ">", 0.55), ("bullish_usd", "<", 0.45, "<", 0.45)],
+        "confidence": ("polarity", 0.65, 0.6),
+        "mtf": {"alignment_score": 0.34, "phase": "transition"},
+        "cross": ("EURUSD_DXY_corr", "EURUSD", "DXY", 0.002),
+        "risk": ("inverse", 7),
+        "vol_multiplier": 1.8,
+        "integrity": ("EURUSD", "DXY", "US10Y"),
+    },
+    "SOL": {
+        "m1": {"SOL": [("twelvedata", "SOL/USD")], "BTC": [BTC_CG], "ETH": [ETH_CG],
+               "TPS": [("solana", None)]},
+        "m2": {},
+        "macro_tone": [(("SOL", "BTC", "ETH"), 0.6)], "macro_tone_default": 0.4,
+        "scenario": [("bullish", ">", 0.55, ">", 0.55), ("bearish", "<", 0.45, "<", 0.45)],
+        "confidence": ("polarity", 0.65, 0.6),
+        "mtf": {"alignment_score": 0.32, "phase": "transition"},
+        "cross": ("SOL_BTC_corr", "SOL", "BTC", 0.0015),
+        "risk": ("inverse", 7),
+        "vol_multiplier": 3.4,
+        "integrity": ("SOL", "BTC", "ETH"),
+    },
+    "US100": {
+        "m1": {"NDX": [("twelvedata", "QQQ"), ("yahoo", "^NDX")], "DXY": [DXY_YH], "VIX": [VIX_YH],
+               "yield_10y": [DGS10]},
+        "m2": {"BTC": [BTC_CG], "ETH": [ETH_CG]},
+        "macro_tone": [(("NDX", "yield_10y", "VIX"), 0.75), (("NDX",), 0.35)], "macro_tone_default": 0.0,
+        "scenario": [("bullish", ">", 0.5, ">", 0.6)],
+        "confidence": ("tone", 0.6, 2),
+        "mtf": {"alignment_score": 0.3, "phase": "divergent"},
+        "cross": ("NDX_BTC_corr", "NDX", "BTC", 0.001),
+        "risk": ("direct", 10),
+        "vol_multiplier": 2,
+        "integrity": ("NDX", "DXY", "VIX", "BTC", "ETH"),
+    },
+    "US10Y": {
+        "m1": {"US10Y": [DGS10], "SPX": [("twelvedata", "SPX")], "VIX": [VIX_TD], "DXY": [DXY_TD]},
+        "m2": {"BTC": [BTC_CG]},
+        "macro_tone": "fraction",
+        "scenario": [("yield_pressure", ">", 0.7, "<", 0.45), ("easing", "<", 0.5, ">", 0.55)],
+        "confidence": ("polarity", 0.6, 0.5),
+        "mtf": {"alignment_score": 0.33, "phase": "rotation"},
+        "cross": ("US10Y_SPX_corr", "US10Y", "SPX", 10),
+        "risk": ("inverse", 7),
+        "vol_multiplier": 2.5,
+        "integrity": ("US10Y", "SPX", "VIX", "BTC"),
+    },
+    "US30": {
+        "m1": {"US30": [("twelvedata", "DJI"), ("yahoo", "^DJI")], "DXY": [DXY_TD], "VIX": [VIX_TD],
+               "US10Y": [DGS10]},
+        "m2": {"BTC": [BTC_CG]},
+        "macro_tone": [(("US30", "DXY", "US10Y"), 0.65)], "macro_tone_default": 0.4,
+        "scenario": [("bullish", ">", 0.6, ">", 0.55), ("bearish", "<", 0.45, "<", 0.45)],
+        "confidence": ("polarity", 0.65, 0.6),
+        "mtf": {"alignment_score": 0.31, "phase": "rotation"},
+        "cross": ("US30_DXY_corr", "US30", "DXY", 0.001),
+        "risk": ("inverse", 7),
+        "vol_multiplier": 1.9,
+        "integrity": ("US30", "DXY", "US10Y"),
+    },
+    "USDJPY": {
+        "m1": {"USDJPY": [("twelvedata", "USD/JPY"), ("yahoo", "JPY=X")], "DXY": [DXY_TD],
+               "US10Y": [DGS10], "BTC": [BTC_CG]},
+        "m2": {},
+        "macro_tone": [(("USDJPY", "DXY", "US10Y"), 0.6)], "macro_tone_default": 0.4,
+        # Inverse macro logic: USD up = JPY weak
+        "scenario": [("bullish_usd", ">", 0.55, ">", 0.55), ("bullish_jpy", "<", 0.45, "<", 0.45)],
+        "confidence": ("polarity", 0.65, 0.6),
+        "mtf": {"alignment_score": 0.33, "phase": "rotation"},
+        "cross": ("USDJPY_DXY_corr", "USDJPY", "DXY", 0.002),
+        "risk": ("inverse", 7),
+        "vol_multiplier": 1.9,
+        "integrity": ("USDJPY", "DXY", "US10Y"),
+    },
+    "USOIL": {
+        "m1": {"WTI": [("twelvedata", "WTI/USD"), ("yahoo", "CL=F")], "DXY": [DXY_YH], "yield_10y": [DGS10]},
+        "m2": {"BTC": [BTC_CG]},
+        "macro_tone": [(("WTI", "yield_10y", "DXY"), 0.7)], "macro_tone_default": 0.35,
+        "scenario": [("bullish", ">", 0.5, ">", 0.55)],
+        "confidence": ("tone", 0.65, 2),
+        "mtf": {"alignment_score": 0.35, "phase": "rotation"},
+        "cross": ("WTI_BTC_corr", "WTI", "BTC", 0.001),
+        "risk": ("direct", 8),
+        "vol_multiplier": 2.6,
+        "integrity": ("WTI", "DXY", "yield_10y", "BTC"),
+    },
+    "XAUUSD": {
+        "m1": {"XAUUSD": [("twelvedata", "XAU/USD"), GOLD_YH], "DXY": [DXY_YH], "yield_10y": [DGS10],
+               "VIX": [VIX_YH]},
+        "m2": {"BTC": [BTC_CG], "ETH": [ETH_CG]},
+        "macro_tone": [(("XAUUSD", "DXY", "yield_10y"), 0.65)], "macro_tone_default": 0.3,
+        "scenario": [("bullish", ">", 0.5, ">", 0.55)],
+        "confidence": ("tone", 0.7, 3),
+        "mtf": {"alignment_score": 0.32, "phase": "accumulation"},
+        "cross": ("XAU_BTC_corr", "XAUUSD", "BTC", 0.001),
+        "risk": ("direct", 9),
+        "vol_multiplier": 2.4,
+        "integrity": ("XAUUSD", "DXY", "yield_10y", "BTC"),
+    },
+    "XRP": {
+        "m1": {"XRP": [("twelvedata", "XRP/USD")], "BTC": [BTC_CG], "ETH": [ETH_CG]},
+        "m2": {"vol_proxy": [BTC_CG]},
+        "macro_tone": [(("XRP", "BTC", "ETH"), 0.6)], "macro_tone_default": 0.4,
+        "scenario": [("bullish", ">", 0.55, ">", 0.55), ("bearish", "<", 0.45, "<", 0.45)],
+        "confidence": ("polarity", 0.65, 0.6),
+        "mtf": {"alignment_score": 0.31, "phase": "rotation"},
+        "cross": ("XRP_BTC_corr", "XRP", "BTC", 0.002),
+        "risk": ("inverse", 7),
+        "vol_multiplier": 3.2,
+        "integrity": ("XRP", "BTC", "ETH"),
+    },
+}
+
+OPS = {">": operator.gt, "<": operator.lt}
+
+
+def input_chains(asset):
+    """All (key, fallback chain) inputs of an asset, including fear/greed."""
+    spec = ASSETS[asset]
+    chains = dict(spec["m1"])
+    chains.update(spec["m2"])
+    chains["fear_greed"] = [FEAR_GREED]
+    return chains
+
+
+def required_sources(assets):
+    """Ordered union of primary sources needed by the given assets."""
+    seen = {}
+    for asset in assets:
+        for chain in input_chains(asset).values():
+            seen.setdefault(chain[0], None)
+    return list(seen)
+
+# ==============================
+# 🧠 MODULES
+# ==============================
+def module_1_macro(spec, inputs):
+    keys = list(spec["m1"])
+    if spec["macro_tone"] == "fraction":
+        tone = sum(inputs[k] is not None for k in keys) / len(keys)
+    else:
+        tone = spec["macro_tone_default"]
+        for required, score in spec["macro_tone"]:
+            if all(inputs[k] for k in required):
+                tone = score
+                break
+    out = {k: inputs[k] for k in keys if not k.startswith("_")}
+    out["macro_tone_score"] = round(tone, 3)
+    return out
+
+def module_2_behavioral(spec, inputs):
+    fg = inputs["fear_greed"] or {"value": None, "classification": None}
+    out = {"fear_greed": fg}
+    out.update({k: inputs[k] for k in spec["m2"]})
+    out["behavioral_polarity"] = round(((fg["value"] or 50) / 100), 3)
+    return out
+
+def module_3_scenario(spec, m1, m2):
+    tone, polarity = m1["macro_tone_score"], m2["behavioral_polarity"]
+    bias = "neutral"
+    for label, tone_op, tone_level, pol_op, pol_level in spec["scenario"]:
+        if OPS[tone_op](tone, tone_level) and OPS[pol_op](polarity, pol_level):
+            bias = label
+            break
+    mode, base, k = spec["confidence"]
+    if mode == "polarity":
+        conf = base + abs(0.5 - polarity) * k
+    else:
+        conf = base + tone / k
+    return {"short_term_bias": bias, "confidence": round(conf, 3)}
+
+def module_4_mtf(spec):
+    return dict(spec["mtf"])
+
+def module_5_cross(spec, m1, m2):
+    name, num, den, scale = spec["cross"]
+    values = {**m2, **m1}
+    try:
+        corr = round(((values[num] or 0) / (values[den] or 1)) * scale, 3)
+    except Exception:
+        corr = 0.0
+    return {name: corr}
+
+def module_6_risk(spec, m1, m2):
+    mode, divisor = spec["risk"]
+    polarity = m2["behavioral_polarity"]
+    if mode == "inverse":
+        polarity = 1 - polarity
+    return {"risk_chain_score": round((m1["macro_tone_score"] + polarity) / divisor, 3)}
+
+def module_7_forecast(spec, m1, m2, m3, m6):
+    return {
+        "directional_bias": m3["short_term_bias"],
+        "expected_volatility_pct": round(m6["risk_chain_score"] * spec["vol_multiplier"], 2),
+        "confidence_score": m3["confidence"],
+    }
+
+# ==============================
+# 🩺 INTEGRITY
+# ==============================
+def compute_data_integrity(spec, m1, m2):
+    values = {**m2, **m1}
+    keys = spec["integrity"]
+    return sum(1 for k in keys if values.get(k)) / len(keys)
+
+
+def run_modules(asset, inputs):
+    """Run M1–M7 for one asset on already-resolved inputs."""
+    spec = ASSETS[asset]
+    m1 = module_1_macro(spec, inputs)
+    m2 = module_2_behavioral(spec, inputs)
+    m3 = module_3_scenario(spec, m1, m2)
+    m4 = module_4_mtf(spec)
+    m5 = module_5_cross(spec, m1, m2)
+    m6 = module_6_risk(spec, m1, m2)
+    m7 = module_7_forecast(spec, m1, m2, m3, m6)
+    modules = {"M1": m1, "M2": m2, "M3": m3, "M4": m4, "M5": m5, "M6": m6, "M7": m7}
+    return modules, compute_data_integrity(spec, m1, m2)
@@ -0,0 +1,97 @@
+# =========================================================
+# fusion_engine/bench.py
+# =========================================================
+# ✅ Offline end-to-end cycle benchmark over recorded fixtures
+# ✅ Replay in-process or through the local stub server
+# ✅ Reports cycle latency, integrity and recovery behaviour as JSON
+# =========================================================
+
+import argparse, json, statistics, tempfile, time
+
+from . import config, quota, replay
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+def run(assets=None, cycles=5, mode="replay", recover_low=True, keep_quota=False):
+    """Run `cycles` fusion cycles against the fixture archive; returns the report dict."""
+    from .engine import fusion_cycle, low_integrity, recover
+
+    if cycles < 1:
+        raise ValueError(f"cycles must be at least 1, got {cycles}")
+    config.REPLAY_MODE = mode
+    config.CACHE_ENABLED = False  # every cycle must hit the (replayed) providers
+    bucket = quota.TWELVEDATA
+    if not keep_quota:
+        # Recorded responses cost no credits; pacing would only measure the bucket.
+        quota.TWELVEDATA = quota.TokenBucket(10 ** 6)
+    replay.reseed()
+    server = None
+    timings, recoveries, integrity, low_total, recovered = [], [], [], 0, 0
+    try:
+        if mode == "stub":
+            from .stub import serve
+            server, config.REPLAY_STUB_URL = serve()
+        for _ in range(cycles):
+            started = time.monotonic()
+            results = fusion_cycle(assets)
+            timings.append(time.monotonic() - started)
+            integrity.extend(results.values())
+            low = low_integrity(results)
+            low_total += len(low)
+            if low and recover_low:
+                started = time.monotonic()
+                after = recover(low)
+                recoveries.append(time.monotonic() - started)
+                recovered += len(low) - len(low_integrity(after))
+    finally:
+        quota.TWELVEDATA = bucket
+        if server:
+            server.shutdown()
+
+    assets_per_cycle = len(integrity) / cycles
+    return {
+        "mode": mode,
+        "cycles": cycles,
+        "assets_per_cycle": assets_per_cycle,
+        "cycle_seconds": {
+            "mean": round(statistics.mean(timings), 4),
+            "p50": round(percentile(timings, 0.5), 4),
+            "p95": round(percentile(timings, 0.95), 4),
+            "max": round(max(timings), 4),
+        },
+        "assets_per_second": round(assets_per_cycle * cycles / sum(timings), 2) if sum(timings) else None,
+        "integrity_mean": round(statistics.mean(integrity), 3) if integrity else None,
+        "low_integrity": low_total,
+        "recoveries": len(recoveries),
+        "recovered": recovered,
+        "recovery_seconds_mean": round(statistics.mean(recoveries), 4) if recoveries else None,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="fusion_engine.bench", description="Offline fusion cycle benchmark")
+    parser.add_argument("assets", nargs="*")
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument("--mode", choices=("replay", "stub"), default="replay")
+    parser.add_argument("--fixtures", default=config.FIXTURE_DIR)
+    parser.add_argument("--latency", default=config.REPLAY_LATENCY, help='seconds, e.g. "0.2" or "api.twelvedata.com=1.5,*=0.1"')
+    parser.add_argument("--fail", default=config.REPLAY_FAIL, help="failure rate(s), same syntax as --latency")
+    parser.add_argument("--seed", type=int, default=config.REPLAY_SEED)
+    parser.add_argument("--no-recover", action="store_true", help="do not run recovery for low-integrity assets")
+    parser.add_argument("--keep-quota", action="store_true", help="keep TwelveData credit pacing")
+    parser.add_argument("--output", help="output root for cycle results (default: a temp dir)")
+    args = parser.parse_args(argv)
+    if args.cycles < 1:
+        parser.error("--cycles must be at least 1")
+
+    config.FIXTURE_DIR, config.REPLAY_LATENCY, config.REPLAY_FAIL = args.fixtures, args.latency, args.fail
+    config.REPLAY_SEED = args.seed
+    config.OUTPUT_ROOT = args.output or tempfile.mkdtemp(prefix="fusion_bench_")
+    config.LOG_ECHO = False
+    report = run(args.assets or None, args.cycles, args.mode, not args.no_recover, args.keep_quota)
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# =========================================================
+# fusion_engine/cache.py
+# =========================================================
+# ✅ On-disk TTL response cache shared by every runtime process
+# ✅ Keyed by provider + symbol, per-provider TTLs
+# ✅ Stale-while-revalidate + lock files so one process refreshes a key
+# =========================================================
+
+import hashlib, json, os, re, threading, time
+
+from . import config
+
+
+def _paths(provider, symbol):
+    base = os.path.join(config.CACHE_DIR, provider)
+    os.makedirs(base, exist_ok=True)
+    name = re.sub(r"[^A-Za-z0-9]+", "_", str(symbol)).strip("_") or "default"
+    digest = hashlib.sha1(str(symbol).encode("utf-8")).hexdigest()[:8]
+    stem = os.path.join(base, f"{name}-{digest}")
+    return stem + ".json", stem + ".lock"
+
+def usable(value):
+    """Failed fetches return None (or a fear/greed dict of Nones) and are never cached."""
+    if isinstance(value, dict) and "value" in value:
+        return value["value"] is not None
+    return value is not None
+
+# ==============================
+# 💾 ENTRIES
+# ==============================
+def read_entry(provider, symbol):
+    path, _ = _paths(provider, symbol)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_entry(provider, symbol, value):
+    path, _ = _paths(provider, symbol)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"provider": provider, "symbol": symbol, "stored_at": time.time(), "value": value}, f)
+    os.replace(tmp, path)
+
+# ==============================
+# 🔒 CROSS-PROCESS REFRESH LOCK
+# ==============================
+def acquire(provider, symbol):
+    _, lock = _paths(provider, symbol)
+    try:
+        fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        try:
+            if time.time() - os.path.getmtime(lock) > config.CACHE_LOCK_SECONDS:
+                os.remove(lock)
+                return acquire(provider, symbol)
+        except OSError:
+            pass
+        return False
+    os.close(fd)
+    return True
+
+def release(provider, symbol):
+    _, lock = _paths(provider, symbol)
+    try:
+        os.remove(lock)
+    except OSError:
+        pass
+
+# ==============================
+# 🔁 CACHED FETCH
+# ==============================
+def ttl_for(provider):
+    return config.CACHE_TTL_SECONDS.get(provider, config.CACHE_DEFAULT_TTL)
+
+def stale_for(provider):
+    return config.CACHE_STALE_SECONDS.get(provider, ttl_for(provider))
+
+def peek(provider, symbol):
+    """(value, fresh) for an entry without fetching; (None, False) when missing or past its stale window."""
+    entry = read_entry(provider, symbol) if config.CACHE_ENABLED else None
+    if not entry:
+        return None, False
+    age = time.time() - entry["stored_at"]
+    if age >= ttl_for(provider) + stale_for(provider):
+        return None, False
+    return entry["value"], age < ttl_for(provider)
+
+def _revalidate(provider, symbol, fetch):
+    try:
+        value = fetch()
+        if usable(value):
+            write_entry(provider, symbol, value)
+    except Exception:
+        pass
+    finally:
+        release(provider, symbol)
+
+def cached_fetch(provider, symbol, fetch):
+    """Return a fresh cached value, a stale one while refreshing in the background, or fetch now.
+
+    An entry past ttl + stale_for is never served, not even when the fetch
+    fails (the same bound as peek()).
+    """
+    if not config.CACHE_ENABLED:
+        return fetch()
+    entry = read_entry(provider, symbol)
+    age = time.time() - entry["stored_at"] if entry else None
+    ttl = ttl_for(provider)
+
+    if entry and age < ttl:
+        return entry["value"]
+    if entry and age < ttl + stale_for(provider):
+        if acquire(provider, symbol):
+            threading.Thread(target=_revalidate, args=(provider, symbol, fetch), daemon=True).start()
+        return entry["value"]
+
+    # Missing or past its stale window: wait briefly if another process is already refreshing.
+    locked = acquire(provider, symbol)
+    deadline = time.monotonic() + config.CACHE_LOCK_WAIT_SECONDS
+    while not locked and time.monotonic() < deadline:
+        time.sleep(0.25)
+        fresh = read_entry(provider, symbol)
+        if fresh and time.time() - fresh["stored_at"] < ttl:
+            return fresh["value"]
+        locked = acquire(provider, symbol)
+
+    try:
+        value = fetch()
+    finally:
+        if locked:
+            release(provider, symbol)
+    if usable(value):
+        write_entry(provider, symbol, value)
+    return value
@@ -0,0 +1,117 @@
+# =========================================================
+# fusion_engine/config.py
+# =========================================================
+# ✅ Shared keys + runtime constants for every asset
+# =========================================================
+
+import os
+
+# ==============================
+# 🔑 API KEYS — paste yours here
+# ==============================
+API_KEYS = {
+    "fred": "dd34406206c77eae198f6512d3dea8a3",
+    "finnhub": "d4alo5hr01qseda29ai0d4alo5hr01qseda29aig",
+    "chartexchange": "i4pf4iqoz9vjz56eebrf2aa2olln50df",
+    "newsapi": "440a0ee7adf040678b329b981b38044b",
+    "twelvedata": "177ea18da03a4d93b437798986b140d5"
+}
+
+# ==============================
+# ⚙️ RUNTIME
+# ==============================
+OUTPUT_ROOT = os.environ.get("FUSION_OUTPUT_ROOT", ".")
+CYCLE_INTERVAL_HOURS = 4
+# Cadence overrides without code edits: "4h", "15m", "1h30m", "900" (seconds).
+CYCLE_INTERVAL = os.environ.get("FUSION_CYCLE_INTERVAL", f"{CYCLE_INTERVAL_HOURS}h")
+CYCLE_OFFSET = os.environ.get("FUSION_CYCLE_OFFSET", "0s")
+CYCLE_JITTER_SECONDS = float(os.environ.get("FUSION_CYCLE_JITTER", "0"))
+CYCLE_MISFIRE_GRACE_SECONDS = 300
+CYCLE_CATCHUP = os.environ.get("FUSION_CYCLE_CATCHUP", "latest")  # skip | latest | gaps
+SCHEDULER_MAX_SLEEP_SECONDS = 60
+DATA_INTEGRITY_THRESHOLD = 0.5
+RECOVERY_BASE_SECONDS = 120
+RECOVERY_MAX_SECONDS = 1800
+RECOVERY_MAX_ATTEMPTS = 5
+REQUEST_TIMEOUT = 10
+FETCH_WORKERS = 8
+CYCLE_DEADLINE_SECONDS = 30
+
+# ==============================
+# 🗄️ OUTPUT STORE
+# ==============================
+# Cycle outputs go to <asset>/STORE/<YYYY-MM>.jsonl; set FUSION_RUNTIME_JSON=1
+# to also write the legacy per-cycle TOTAL_RECALL_RUNTIME_<ts>.json files.
+STORE_DIR = "STORE"
+WRITE_RUNTIME_JSON = os.environ.get("FUSION_RUNTIME_JSON", "0") == "1"
+
+# ==============================
+# 🧩 LOGGING
+# ==============================
+LOG_FILE = "FUSION_LOG.jsonl"
+ENGINE_LOG_FILE = "FUSION_ENGINE_LOG.jsonl"
+LOG_ECHO = os.environ.get("FUSION_LOG_ECHO", "1") != "0"
+LOG_QUEUE_SIZE = 10000
+LOG_FLUSH_SECONDS = 1.0
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_ROTATE_SECONDS = 24 * 3600
+LOG_BACKUPS = 7
+
+# ==============================
+# 🎞️ RECORD / REPLAY
+# ==============================
+# record: live calls, responses saved to FIXTURE_DIR
+# replay: served from FIXTURE_DIR in-process, no network
+# stub:   sent to the local stub server (python -m fusion_engine.stub)
+REPLAY_MODE = os.environ.get("FUSION_REPLAY", "")
+FIXTURE_DIR = os.environ.get("FUSION_FIXTURES", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures"))
+REPLAY_LATENCY = os.environ.get("FUSION_REPLAY_LATENCY", "0")  # "0.2" or "api.twelvedata.com=1.5,*=0.1"
+REPLAY_FAIL = os.environ.get("FUSION_REPLAY_FAIL", "0")  # failure rate, same syntax
+REPLAY_SEED = int(os.environ.get("FUSION_REPLAY_SEED", "0"))
+REPLAY_STUB_URL = os.environ.get("FUSION_REPLAY_STUB", "http://127.0.0.1:8765")
+
+# ==============================
+# 🔌 HTTP POOLS
+# ==============================
+HTTP_POOL_MAXSIZE = FETCH_WORKERS
+HTTP_RETRIES = 2
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# ==============================
+# 📦 TWELVEDATA QUOTA
+# ==============================
+TWELVEDATA_CREDITS_PER_MINUTE = 8
+TWELVEDATA_BATCH_SIZE = 8
+
+# ==============================
+# 💾 RESPONSE CACHE
+# ==============================
+# Shared by every runtime process on the box; TTLs follow how often each
+# upstream actually changes (FRED DGS10 is daily, fear/greed is daily).
+CACHE_ENABLED = os.environ.get("FUSION_CACHE", "1") != "0"
+CACHE_DIR = os.environ.get("FUSION_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "fusion_engine"))
+CACHE_DEFAULT_TTL = 300
+CACHE_TTL_SECONDS = {
+    "twelvedata": 300,
+    "yahoo": 300,
+    "yahoo_series": 600,
+    "coingecko": 300,
+    "fred": 6 * 3600,
+    "feargreed": 3600,
+    "finnhub": 3600,
+    "solana": 300,
+}
+# How long past its TTL an entry may still be served while one process refreshes it.
+CACHE_STALE_SECONDS = {
+    "fred": 24 * 3600,
+    "feargreed": 6 * 3600,
+}
+CACHE_LOCK_SECONDS = 60
+CACHE_LOCK_WAIT_SECONDS = 5
+
+
+def asset_path(asset, *parts):
+    path = os.path.join(OUTPUT_ROOT, asset)
+    os.makedirs(path, exist_ok=True)
+    return os.path.join(path, *parts)
@@ -0,0 +1,115 @@
+# =========================================================
+# fusion_engine/engine.py
+# =========================================================
+# ✅ Multi-asset fusion cycle — one process, every asset
+# ✅ Shared inputs (DXY, VIX, DGS10, BTC, fear/greed) fetched once per cycle
+# ✅ Concurrent fetch phase — M1–M7 run per asset as soon as its inputs land
+# =========================================================
+
+import datetime, json, time
+
+from . import cache, config, store
+from .assets import ASSETS, input_chains, run_modules
+from .logs import log, write_summary
+from .phase import FetchPhase, collect, served_by
+
+# ==============================
+# 🔁 FUSION CYCLE
+# ==============================
+def format_summary(asset, now, modules, integrity):
+    lines = [f"{asset} FUSION SUMMARY ({now})", "-----------------------------------------------------------"]
+    for name, values in modules.items():
+        fields = " | ".join(f"{k}: {v}" for k, v in values.items())
+        lines.append(f"[{name}] {fields}")
+    lines.append(f"Integrity: {integrity:.2f}")
+    return "\n".join(lines) + "\n"
+
+def publish(asset, now, modules, integrity, cycle_utc=None, duration=None, sources=None):
+    """Store one asset's cycle output and log it as a single structured record."""
+    output = {"timestamp_utc": now, "cycle_utc": cycle_utc or now, "modules": modules}
+    filename = store.append(asset, output)
+    if config.WRITE_RUNTIME_JSON:
+        stamp = datetime.datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+        filename = config.asset_path(asset, f"TOTAL_RECALL_RUNTIME_{stamp}.json")
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
+
+    write_summary(asset, format_summary(asset, now, modules, integrity))
+    log(f"✅ {asset} published — integrity {integrity:.2f}", asset,
+        event="cycle", cycle_utc=cycle_utc or now, timestamp_utc=now,
+        duration=None if duration is None else round(duration, 3),
+        sources=sources or {}, integrity=round(integrity, 4),
+        modules=modules, file=filename)
+
+def fusion_cycle(assets=None, cycle_utc=None):
+    """Run one cycle for every asset; returns {asset: integrity}.
+
+    cycle_utc is the nominal UTC boundary the cycle belongs to, shared by all
+    assets so their samples line up even when the cycle starts late.
+    """
+    assets = list(assets or ASSETS)
+    now = datetime.datetime.utcnow().isoformat() + "Z"
+    log(f"Fusion cycle [{', '.join(assets)}] {cycle_utc or now}",
+        event="cycle_start", assets=assets, cycle_utc=cycle_utc or now)
+
+    started = time.monotonic()
+    phase = FetchPhase()
+    results = {}
+    try:
+        for asset, inputs in phase.ready(assets):
+            last_inputs[asset] = inputs
+            last_cycle_utc[asset] = cycle_utc or now
+            modules, integrity = run_modules(asset, inputs)
+            publish(asset, now, modules, integrity, cycle_utc,
+                    duration=time.monotonic() - started, sources=phase.served.get(asset))
+            results[asset] = integrity
+    finally:
+        phase.close()
+    duration = time.monotonic() - started
+    log(f"🌐 {len(phase.sources)} upstream requests for {len(assets)} assets in {duration:.1f}s",
+        event="cycle_end", cycle_utc=cycle_utc or now, assets=assets,
+        requests=len(phase.sources), duration=round(duration, 3))
+    return results
+
+# ==============================
+# 🩺 AUTORECOVERY
+# ==============================
+# Inputs of the latest cycle per asset, so recovery only refetches what is missing.
+last_inputs = {}
+last_cycle_utc = {}
+
+
+def missing_inputs(asset):
+    return [k for k, v in last_inputs.get(asset, {}).items() if not (v and cache.usable(v))]
+
+def low_integrity(results):
+    return [a for a, score in results.items() if score < config.DATA_INTEGRITY_THRESHOLD]
+
+def recover(assets):
+    """Refetch only the missing inputs of the given assets and republish them."""
+    now = datetime.datetime.utcnow().isoformat() + "Z"
+    started = time.monotonic()
+    phase = FetchPhase()
+    results = {}
+    try:
+        wanted = {}
+        for asset in assets:
+            chains = input_chains(asset)
+            missing = missing_inputs(asset)
+            log(f"🩺 Recovery {asset}: refetching {', '.join(missing) or 'nothing'}", asset,
+                event="recovery", missing=missing)
+            wanted[asset] = {key: phase.resolve(chains[key]) for key in missing}
+        for asset, futures in wanted.items():
+            inputs = dict(last_inputs[asset])
+            inputs.update(collect(futures, phase.remaining()))
+            last_inputs[asset] = inputs
+            modules, integrity = run_modules(asset, inputs)
+            publish(asset, now, modules, integrity, last_cycle_utc.get(asset),
+                    duration=time.monotonic() - started, sources=served_by(futures))
+            results[asset] = integrity
+    finally:
+        phase.close()
+    log(f"🩺 Recovery used {len(phase.sources)} upstream requests for {len(assets)} assets",
+        event="recovery_end", assets=list(assets), requests=len(phase.sources),
+        duration=round(time.monotonic() - started, 3))
+    return results
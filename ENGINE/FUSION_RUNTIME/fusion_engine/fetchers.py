@@ -0,0 +1,140 @@
+# =========================================================
+# fusion_engine/fetchers.py
+# =========================================================
+# ✅ One implementation of every provider fetcher
+# ✅ Sources are (provider, symbol) pairs shared by all assets
+# ✅ HTTP goes through the pooled keep-alive sessions in transport.py
+# ✅ Responses are shared across processes via the TTL cache in cache.py
+# =========================================================
+
+from . import cache, config, quota, transport
+from .config import API_KEYS
+from .logs import log
+
+# ==============================
+# 🌐 DATA FETCHERS
+# ==============================
+def fetch_twelvedata(symbol):
+    try:
+        if not quota.TWELVEDATA.acquire(1, timeout=config.CYCLE_DEADLINE_SECONDS):
+            raise Exception("credit quota exhausted")
+        url = f"https://api.twelvedata.com/price?symbol={symbol}&apikey={API_KEYS['twelvedata']}"
+        r = transport.get(url)
+        d = r.json()
+        if "price" in d:
+            log(f"✅ TwelveData {symbol}: {d['price']}")
+            return float(d["price"])
+        raise Exception(d)
+    except Exception as e:
+        log(f"❌ TwelveData {symbol} failed: {e}")
+        return None
+
+def fetch_twelvedata_batch(symbols, timeout=None, partial=False):
+    """One comma-separated /price call for several symbols → {symbol: price or None}.
+
+    With partial=True only as many symbols as there are credits left are
+    requested, without waiting; the rest come back as None.
+    """
+    prices = dict.fromkeys(symbols)
+    try:
+        if partial:
+            symbols = symbols[:quota.TWELVEDATA.take(len(symbols))]
+            if not symbols:
+                raise Exception("credit quota exhausted")
+        elif not quota.TWELVEDATA.acquire(len(symbols), timeout=timeout):
+            raise Exception("credit quota exhausted")
+        url = f"https://api.twelvedata.com/price?symbol={','.join(symbols)}&apikey={API_KEYS['twelvedata']}"
+        r = transport.get(url)
+        d = r.json()
+        if len(symbols) == 1:
+            d = {symbols[0]: d}
+        for symbol in symbols:
+            quote = d.get(symbol) or {}
+            prices[symbol] = float(quote["price"]) if "price" in quote else None
+            if prices[symbol] is None:
+                log(f"❌ TwelveData {symbol} failed: {quote}")
+        log(f"✅ TwelveData batch [{', '.join(symbols)}]")
+        return prices
+    except Exception as e:
+        log(f"❌ TwelveData batch {', '.join(symbols)} failed: {e}")
+        return prices
+
+def fetch_yahoo(symbol):
+    try:
+        url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+        r = transport.get(url)
+        d = r.json()
+        return d["chart"]["result"][0]["meta"]["regularMarketPrice"]
+    except Exception as e:
+        log(f"⚠️ Yahoo {symbol} failed: {e}")
+        return None
+
+def fetch_fred(series_id):
+    try:
+        url = f"https://api.stlouisfed.org/fred/series/observations?series_id={series_id}&api_key={API_KEYS['fred']}&file_type=json"
+        r = transport.get(url)
+        d = r.json()
+        return float(d["observations"][-1]["value"])
+    except Exception as e:
+        log(f"⚠️ FRED {series_id} fetch failed: {e}")
+        return None
+
+def fetch_crypto(symbol="bitcoin"):
+    try:
+        url = f"https://api.coingecko.com/api/v3/simple/price?ids={symbol}&vs_currencies=usd"
+        r = transport.get(url)
+        return r.json()[symbol]["usd"]
+    except Exception as e:
+        log(f"⚠️ CoinGecko {symbol} failed: {e}")
+        return None
+
+def fetch_fear_greed(_symbol=None):
+    try:
+        r = transport.get("https://api.alternative.me/fng/")
+        d = r.json()
+        return {
+            "value": int(d["data"][0]["value"]),
+            "classification": d["data"][0]["value_classification"],
+        }
+    except Exception as e:
+        log(f"⚠️ FearGreed fetch failed: {e}")
+        return {"value": None, "classification": None}
+
+def fetch_finnhub_sentiment(symbol="BTC-USD"):
+    try:
+        url = f"https://finnhub.io/api/v1/news-sentiment?symbol={symbol}&token={API_KEYS['finnhub']}"
+        r = transport.get(url)
+        d = r.json()
+        return d.get("buzz", {}).get("articlesInLastWeek", 0)
+    except Exception as e:
+        log(f"⚠️ Finnhub sentiment failed: {e}")
+        return None
+
+def fetch_solana_network_stats(_symbol=None):
+    try:
+        url = "https://api.mainnet-beta.solana.com"
+        payload = {"jsonrpc": "2.0", "id": 1, "method": "getRecentPerformanceSamples", "params": [1]}
+        r = transport.post(url, json=payload)
+        d = r.json()
+        samples = d.get("result", [{}])[0]
+        tps = samples.get("numTransactions", 0) / max(samples.get("samplePeriodSecs", 1), 1)
+        return round(tps, 2)
+    except Exception as e:
+        log(f"⚠️ Solana network fetch failed: {e}")
+        return None
+
+FETCHERS = {
+    "twelvedata": fetch_twelvedata,
+    "yahoo": fetch_yahoo,
+    "fred": fetch_fred,
+    "coingecko": fetch_crypto,
+    "feargreed": fetch_fear_greed,
+    "finnhub": fetch_finnhub_sentiment,
+    "solana": fetch_solana_network_stats,
+}
+
+
+def fetch_source(source):
+    """Fetch one (provider, symbol) source through the shared response cache."""
+    provider, symbol = source
+    return cache.cached_fetch(provider, symbol, lambda: FETCHERS[provider](symbol))
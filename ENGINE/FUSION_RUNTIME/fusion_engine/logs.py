@@ -0,0 +1,151 @@
+# =========================================================
+# fusion_engine/logs.py
+# =========================================================
+# ✅ Buffered JSON-lines logging for the engine + every asset
+# ✅ Background writer: bounded queue, batched writes, periodic flush
+# ✅ Size/time-based rotation with a fixed number of backups
+# =========================================================
+
+import atexit, datetime, functools, glob, json, os, queue, threading, time
+
+from . import config
+
+
+class LogWriter:
+    """Owns the log files; callers only enqueue records and never touch disk."""
+
+    def __init__(self):
+        self.queue = queue.Queue(maxsize=config.LOG_QUEUE_SIZE)
+        self.files = {}
+        self.dropped = 0
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def start(self):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name="fusion-log", daemon=True)
+                self.thread.start()
+
+    def put(self, record):
+        self.start()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Never stall a cycle on logging; account for the loss instead.
+            with self.lock:
+                self.dropped += 1
+
+    # ==============================
+    # 🧵 WRITER THREAD
+    # ==============================
+    def run(self):
+        last_flush = time.monotonic()
+        while True:
+            try:
+                record = self.queue.get(timeout=config.LOG_FLUSH_SECONDS)
+            except queue.Empty:
+                record = None
+            if record is not None:
+                self.write(record)
+                # Drain whatever else is waiting so it goes out in one batch.
+                while True:
+                    try:
+                        self.write(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+            if time.monotonic() - last_flush >= config.LOG_FLUSH_SECONDS:
+                self.flush()
+                last_flush = time.monotonic()
+
+    def write(self, record):
+        if record is FLUSH:
+            self.flush()
+            FLUSH.done.set()
+            return
+        with self.lock:
+            dropped, self.dropped = self.dropped, 0
+        if dropped:
+            record["dropped_before"] = dropped
+        if config.LOG_ECHO:
+            print(record["msg"])
+        path = record.pop("path")
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        handle = self.handle(path)
+        handle["file"].write(line)
+        handle["size"] += len(line.encode("utf-8"))
+
+    # ==============================
+    # 🔄 FILES + ROTATION
+    # ==============================
+    def handle(self, path):
+        handle = self.files.get(path)
+        if handle and self.due(handle):
+            handle["file"].close()
+            self.rotate(path)
+            handle = None
+        if handle is None:
+            f = open(path, "a", encoding="utf-8")
+            handle = {"file": f, "size": f.tell(), "opened": time.time()}
+            self.files[path] = handle
+        return handle
+
+    def due(self, handle):
+        too_big = handle["size"] >= config.LOG_MAX_BYTES
+        too_old = time.time() - handle["opened"] >= config.LOG_ROTATE_SECONDS
+        return too_big or too_old
+
+    def rotate(self, path):
+        if os.path.exists(path) and os.path.getsize(path):
+            stem, ext = os.path.splitext(path)
+            stamp = datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")
+            os.replace(path, f"{stem}.{stamp}{ext}")
+            backups = sorted(glob.glob(f"{stem}.*{ext}"))
+            for old in backups[:-config.LOG_BACKUPS]:
+                os.remove(old)
+        self.files.pop(path, None)
+
+    def flush(self):
+        for handle in self.files.values():
+            handle["file"].flush()
+
+    def close(self, timeout=5):
+        """Block until everything queued so far is on disk."""
+        if self.thread is None or not self.thread.is_alive():
+            return
+        FLUSH.done.clear()
+        try:
+            self.queue.put(FLUSH, timeout=timeout)
+            FLUSH.done.wait(timeout)
+        except queue.Full:
+            pass
+
+
+class _Flush:
+    done = threading.Event()
+
+
+FLUSH = _Flush()
+writer = LogWriter()
+atexit.register(writer.close)
+
+
+@functools.lru_cache(maxsize=None)
+def log_path(asset):
+    return config.asset_path(asset or "", config.LOG_FILE if asset else config.ENGINE_LOG_FILE)
+
+def log(msg, asset=None, **fields):
+    """Queue a structured log line for the asset log (or the engine log)."""
+    record = {
+        "ts": datetime.datetime.utcnow().isoformat() + "Z",
+        "asset": asset,
+        "msg": msg,
+        "path": log_path(asset),
+    }
+    record.update(fields)
+    writer.put(record)
+
+
+def write_summary(asset, text):
+    with open(config.asset_path(asset, "SUMMARY_LAST.txt"), "w", encoding="utf-8") as f:
+        f.write(text)
@@ -0,0 +1,168 @@
+# =========================================================
+# fusion_engine/phase.py
+# =========================================================
+# ✅ Concurrent fetch phase under a cycle-wide deadline
+# ✅ Each (provider, symbol) is requested at most once per cycle
+# ✅ Assets are handed back as soon as their own inputs resolve
+# ✅ TwelveData quotes are batched into comma-separated calls
+# =========================================================
+
+import threading, time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError, as_completed, wait
+
+from . import cache, config
+from .assets import input_chains
+from .fetchers import fetch_source, fetch_twelvedata_batch
+
+
+class FetchPhase:
+    """Thread-pool fetch phase; latency is bounded by the slowest call, not the sum."""
+
+    def __init__(self, workers=None, deadline=None):
+        self.pool = ThreadPoolExecutor(max_workers=workers or config.FETCH_WORKERS,
+                                       thread_name_prefix="fusion-fetch")
+        self.deadline = time.monotonic() + (deadline or config.CYCLE_DEADLINE_SECONDS)
+        self.sources = {}
+        self.served = {}
+        self.lock = threading.Lock()
+
+    def remaining(self):
+        return max(0.0, self.deadline - time.monotonic())
+
+    # ==============================
+    # 🌐 SOURCES + FALLBACK CHAINS
+    # ==============================
+    def get(self, source):
+        """Future for one source, submitted on first use."""
+        with self.lock:
+            if source not in self.sources:
+                self.sources[source] = self.pool.submit(fetch_source, source)
+            return self.sources[source]
+
+    def resolve(self, chain):
+        """Future for the first truthy value along a fallback chain; .source is the one that served it."""
+        result = Future()
+
+        def step(i):
+            self.get(chain[i]).add_done_callback(lambda f: done(i, f))
+
+        def done(i, f):
+            value = None if f.cancelled() or f.exception() else f.result()
+            if value or i + 1 == len(chain) or not self.remaining():
+                result.source = chain[i] if value else None
+                result.set_result(value)
+            else:
+                step(i + 1)
+
+        step(0)
+        return result
+
+    # ==============================
+    # 📦 TWELVEDATA BATCHES
+    # ==============================
+    def batch_twelvedata(self, assets):
+        """Pre-seed every TwelveData source of the cycle from as few calls as possible."""
+        symbols, last_resort = [], set()
+        for asset in assets:
+            for chain in input_chains(asset).values():
+                for provider, symbol in chain:
+                    if provider == "twelvedata" and symbol not in symbols:
+                        symbols.append(symbol)
+                if chain[-1][0] == "twelvedata":
+                    last_resort.add(chain[-1][1])
+        # Symbols with no fallback go first in case the quota runs dry mid-cycle.
+        symbols.sort(key=lambda s: s not in last_resort)
+
+        missing = {}
+        for symbol in symbols:
+            value, fresh = cache.peek("twelvedata", symbol)
+            future = Future()
+            if fresh:
+                future.set_result(value)
+            else:
+                missing[symbol] = (future, value)
+            self.sources[("twelvedata", symbol)] = future
+
+        # Only symbols without a fallback wait for quota; the rest fall through
+        # to their fallback source right away when the bucket is empty.
+        size = config.TWELVEDATA_BATCH_SIZE
+        for last_resort_group in (True, False):
+            group = [s for s in missing if (s in last_resort) == last_resort_group]
+            for i in range(0, len(group), size):
+                chunk = {s: missing[s] for s in group[i:i + size]}
+                self.pool.submit(self._run_batch, chunk, last_resort_group)
+
+    def _run_batch(self, chunk, last_resort_group):
+        try:
+            if last_resort_group:
+                prices = fetch_twelvedata_batch(list(chunk), timeout=self.remaining())
+            else:
+                prices = fetch_twelvedata_batch(list(chunk), partial=True)
+        except Exception:
+            prices = {}
+        for symbol, (future, stale) in chunk.items():
+            value = prices.get(symbol)
+            if cache.usable(value):
+                cache.write_entry("twelvedata", symbol, value)
+            elif last_resort_group:
+                value = stale  # last resort: a recent stale price beats none
+            else:
+                value = None  # let resolve() move on to the fallback source
+            future.set_result(value)
+
+    def inputs_for(self, asset):
+        return {key: self.resolve(chain) for key, chain in input_chains(asset).items()}
+
+    # ==============================
+    # ⏱️ READINESS
+    # ==============================
+    def ready(self, assets):
+        """Yield (asset, inputs) in completion order; unresolved inputs are None at the deadline."""
+        self.batch_twelvedata(assets)
+        pending = {asset: self.inputs_for(asset) for asset in assets}
+        gates = {}
+        for asset, chains in pending.items():
+            gate = Future()
+            gates[gate] = asset
+            self._arm(gate, list(chains.values()))
+
+        try:
+            for gate in as_completed(gates, timeout=self.remaining()):
+                asset = gates[gate]
+                self.served[asset] = served_by(pending[asset])
+                yield asset, collect(pending.pop(asset))
+        except TimeoutError:
+            for asset in list(pending):
+                self.served[asset] = served_by(pending[asset])
+                yield asset, collect(pending.pop(asset))
+
+    def _arm(self, gate, futures):
+        count = [len(futures)]
+        lock = threading.Lock()
+
+        def tick(_):
+            with lock:
+                count[0] -= 1
+                if count[0] == 0:
+                    gate.set_result(True)
+
+        for f in futures:
+            f.add_done_callback(tick)
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+def collect(chains, timeout=0):
+    """Values of resolved futures, waiting up to timeout in total; None for the rest."""
+    if timeout:
+        wait(list(chains.values()), timeout=timeout)
+    return {key: f.result() if f.done() else None for key, f in chains.items()}
+
+def served_by(chains):
+    """{key: "provider:symbol"} of the source each resolved chain came from; None if none did."""
+    sources = {}
+    for key, f in chains.items():
+        source = getattr(f, "source", None) if f.done() else None
+        sources[key] = ":".join(filter(None, source)) if source else None
+    return sources
@@ -0,0 +1,56 @@
+# =========================================================
+# fusion_engine/quota.py
+# =========================================================
+# ✅ Token-bucket pacing for credit-limited providers
+# ✅ Spreads calls across the minute instead of bursting into 429s
+# =========================================================
+
+import threading, time
+
+from . import config
+
+
+class TokenBucket:
+    """Thread-safe bucket refilled continuously at `per_minute` tokens/minute."""
+
+    def __init__(self, per_minute, capacity=None):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity or per_minute
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, n=1, timeout=None):
+        """Take n tokens, waiting for the refill; False if timeout expires first."""
+        n = min(n, self.capacity)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= n:
+                    self.tokens -= n
+                    return True
+                wait = (n - self.tokens) / self.rate
+            if deadline is not None:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    return False
+                wait = min(wait, left)
+            time.sleep(wait)
+
+    def take(self, n):
+        """Take up to n tokens without waiting; returns how many were granted."""
+        with self.lock:
+            self._refill()
+            granted = min(n, int(self.tokens))
+            self.tokens -= granted
+            return granted
+
+
+# TwelveData bills one credit per symbol, batched or not.
+TWELVEDATA = TokenBucket(config.TWELVEDATA_CREDITS_PER_MINUTE)
@@ -0,0 +1,189 @@
+# =========================================================
+# fusion_engine/replay.py
+# =========================================================
+# ✅ Record raw provider responses into a fixture archive
+# ✅ Replay them offline, in recorded order, with latency + failure injection
+# ✅ Same archive backs the local stub server (stub.py)
+# =========================================================
+
+import datetime, hashlib, json, os, threading, time
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+
+from . import config
+
+# Never written to fixtures, and ignored when matching a request to one.
+SECRET_PARAMS = {"apikey", "api_key", "token", "key"}
+
+
+def normalize(url):
+    """host/path?query with secrets dropped and params sorted — the fixture identity of a url."""
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k.lower() not in SECRET_PARAMS)
+    return f"{parts.netloc}{parts.path or '/'}" + (f"?{urlencode(query)}" if query else "")
+
+def request_key(method, url, body=None):
+    raw = f"{method.upper()} {normalize(url)} {json.dumps(body, sort_keys=True) if body is not None else ''}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+# ==============================
+# 🗄️ FIXTURE ARCHIVE
+# ==============================
+class Archive:
+    """One JSON file per request key holding every recorded response, oldest first."""
+
+    def __init__(self, root):
+        self.root = root
+        self.cursor = {}
+        self.lock = threading.Lock()
+
+    def path(self, key):
+        return os.path.join(self.root, key[:2], f"{key}.json")
+
+    def load(self, key):
+        try:
+            with open(self.path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def add(self, key, entry):
+        path = self.path(key)
+        with self.lock:
+            entries = self.load(key) + [entry]
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2, ensure_ascii=False)
+            os.replace(tmp, path)
+
+    def next(self, key):
+        """Responses come back in recorded order; the last one repeats once exhausted."""
+        entries = self.load(key)
+        if not entries:
+            return None
+        with self.lock:
+            i = self.cursor.get(key, 0)
+            self.cursor[key] = i + 1
+        return entries[min(i, len(entries) - 1)]
+
+_archives = {}
+
+def archive():
+    root = config.FIXTURE_DIR
+    if root not in _archives:
+        _archives[root] = Archive(root)
+    return _archives[root]
+
+# ==============================
+# 💥 LATENCY + FAILURE INJECTION
+# ==============================
+def parse_spec(text):
+    """"0.2" or "api.twelvedata.com=1.5,*=0.1" → {host suffix: value}."""
+    spec = {}
+    for part in str(text or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        host, _, value = part.rpartition("=")
+        spec[host or "*"] = float(value)
+    return spec
+
+def for_host(spec, host):
+    for pattern, value in spec.items():
+        if pattern != "*" and host and host.endswith(pattern):
+            return value
+    return spec.get("*", 0.0)
+
+_seed = config.REPLAY_SEED
+_calls = {}
+_calls_lock = threading.Lock()
+
+def inject(host, key=None):
+    """Sleep for the configured latency; True when this call should fail.
+
+    The decision is a hash of (seed, request key, how many times that key was
+    asked before), so the same seed fails the same requests whatever order
+    concurrent fetches reach this in.
+    """
+    delay = for_host(parse_spec(config.REPLAY_LATENCY), host)
+    if delay:
+        time.sleep(delay)
+    rate = for_host(parse_spec(config.REPLAY_FAIL), host)
+    if rate <= 0:
+        return False
+    key = key or host
+    with _calls_lock:
+        n = _calls[key] = _calls.get(key, -1) + 1
+    digest = hashlib.sha256(f"{_seed}|{key}|{n}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") / 2 ** 64 < rate
+
+def reseed(seed=None):
+    global _seed
+    with _calls_lock:
+        _seed = config.REPLAY_SEED if seed is None else seed
+        _calls.clear()
+
+# ==============================
+# 🎞️ RECORD / REPLAY
+# ==============================
+class Replayed:
+    """The slice of requests.Response the fetchers use."""
+
+    def __init__(self, entry, url):
+        self.url = url
+        self.status_code = entry["status"]
+        self.headers = {"Content-Type": entry.get("content_type") or "application/json"}
+        self.text = entry["body"]
+        self.content = self.text.encode("utf-8")
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} (replayed) for {normalize(self.url)}", response=self)
+
+def record(method, url, body, response, elapsed):
+    archive().add(request_key(method, url, body), {
+        "method": method.upper(),
+        "url": normalize(url),
+        "body_json": body,
+        "status": response.status_code,
+        "content_type": response.headers.get("Content-Type"),
+        "body": response.text,
+        "elapsed": round(elapsed, 3),
+        "recorded_at": datetime.datetime.utcnow().isoformat() + "Z",
+    })
+
+def respond(method, url, body=None):
+    """Serve a request from the archive, as if it had gone over the network."""
+    key = request_key(method, url, body)
+    if inject(urlsplit(url).hostname, key):
+        raise requests.ConnectionError(f"injected failure for {normalize(url)}")
+    entry = archive().next(key)
+    if entry is None:
+        raise requests.ConnectionError(f"no fixture for {method.upper()} {normalize(url)}")
+    return Replayed(entry, url)
+
+def stub_url(url):
+    """Point a provider url at the local stub server: <stub>/<host>/<path>?<query>."""
+    parts = urlsplit(url)
+    return f"{config.REPLAY_STUB_URL.rstrip('/')}/{parts.netloc}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+
+def value(provider, key, fetch):
+    """Value-level fixtures for providers that do not go through transport (e.g. pytrends)."""
+    fixture = request_key("VALUE", f"{provider}/{key}")
+    if config.REPLAY_MODE in ("replay", "stub"):
+        if inject(provider, fixture):
+            raise requests.ConnectionError(f"injected failure for {provider}")
+        entry = archive().next(fixture)
+        if entry is None:
+            raise requests.ConnectionError(f"no fixture for {provider}/{key}")
+        return entry["value"]
+    result = fetch()
+    if config.REPLAY_MODE == "record":
+        archive().add(fixture, {"provider": provider, "key": key, "value": result,
+                                "recorded_at": datetime.datetime.utcnow().isoformat() + "Z"})
+    return result
@@ -0,0 +1,161 @@
+# =========================================================
+# fusion_engine/scheduler.py
+# =========================================================
+# ✅ Event-queue scheduler for cycles + autorecovery
+# ✅ Cycles fire on exact UTC boundaries (00:00, 04:00, ...) — no drift
+# ✅ Jitter control, missed-cycle catch-up policy, sub-hour cadences
+# ✅ Low integrity retries only the missing inputs with exponential backoff
+# =========================================================
+
+import datetime, heapq, itertools, random, re, time
+
+from . import config
+from .assets import ASSETS
+from .engine import fusion_cycle, low_integrity, recover
+from .logs import log
+
+UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+# Missed cycles are never re-run: live data fetched now would be stamped with
+# past boundaries. "gaps" logs each missed boundary, then runs the latest.
+CATCHUP_POLICIES = ("skip", "latest", "gaps")
+
+
+def parse_interval(text, allow_zero=False):
+    """'4h' / '15m' / '1h30m' / '900' → seconds; zero only with allow_zero (offsets)."""
+    text = str(text).strip().lower()
+    if re.fullmatch(r"\d+(\.\d+)?", text):
+        seconds = float(text)
+    else:
+        parts = re.findall(r"(\d+(?:\.\d+)?)\s*([smhd])", text)
+        if not parts or "".join(n + u for n, u in parts) != text.replace(" ", ""):
+            raise ValueError(f"invalid interval: {text!r}")
+        seconds = sum(float(n) * UNITS[u] for n, u in parts)
+    if seconds <= 0 and not allow_zero:
+        raise ValueError(f"interval must be positive: {text!r}")
+    return seconds
+
+def next_boundary(now, interval, offset=0):
+    """First UTC multiple of `interval` (shifted by `offset`) strictly after `now`."""
+    return (int((now - offset) // interval) + 1) * interval + offset
+
+def last_boundary(now, interval, offset=0):
+    """Latest UTC multiple of `interval` (shifted by `offset`) at or before `now`."""
+    return int((now - offset) // interval) * interval + offset
+
+def utc(ts):
+    return datetime.datetime.utcfromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S UTC")
+
+def iso(ts):
+    return datetime.datetime.utcfromtimestamp(ts).isoformat() + "Z"
+
+def sleep_until(ts):
+    """Sleep in bounded slices re-reading the wall clock, so oversleep, clock
+    steps and suspends never push a cycle off its boundary."""
+    while True:
+        left = ts - time.time()
+        if left <= 0:
+            return
+        time.sleep(min(left, config.SCHEDULER_MAX_SLEEP_SECONDS))
+
+
+class CycleScheduler:
+    """Runs cycles at UTC boundaries and recovery attempts in between."""
+
+    def __init__(self, assets=None, interval=None, offset=None, jitter=None, catchup=None):
+        self.assets = list(assets or ASSETS)
+        self.interval = parse_interval(interval or config.CYCLE_INTERVAL)
+        self.offset = parse_interval(offset or config.CYCLE_OFFSET, allow_zero=True)
+        self.jitter = config.CYCLE_JITTER_SECONDS if jitter is None else jitter
+        self.catchup = catchup or config.CYCLE_CATCHUP
+        if self.catchup not in CATCHUP_POLICIES:
+            raise ValueError(f"catchup must be one of {', '.join(CATCHUP_POLICIES)}")
+        if 86400 % self.interval:
+            log(f"⚠️ Interval {self.interval:g}s does not divide a day — cycles won't land on 00:00 UTC")
+        self.queue = []
+        self.seq = itertools.count()
+        self.next_cycle = None
+
+    def push(self, when, kind, payload=None):
+        heapq.heappush(self.queue, (when, next(self.seq), kind, payload))
+
+    def push_cycle(self, boundary):
+        """Queue the cycle for `boundary`; jitter delays the start, never the nominal time."""
+        self.next_cycle = boundary
+        delay = random.uniform(0, self.jitter) if self.jitter else 0
+        self.push(boundary + delay, "cycle", boundary)
+
+    # ==============================
+    # 🔁 EVENTS
+    # ==============================
+    def on_cycle(self, boundary):
+        now = time.time()
+        if boundary is None:
+            # Startup cycle: run now, stamped with the boundary we are inside.
+            boundary = last_boundary(now, self.interval, self.offset)
+        elif now - boundary > config.CYCLE_MISFIRE_GRACE_SECONDS + self.jitter:
+            latest = last_boundary(now, self.interval, self.offset)
+            missed = int((latest - boundary) // self.interval) + 1
+            if self.catchup == "skip":
+                log(f"⏭️ Skipping {missed} missed cycle(s) since {utc(boundary)}")
+                self.push_cycle(next_boundary(now, self.interval, self.offset))
+                return
+            if self.catchup == "latest":
+                if missed > 1:
+                    log(f"⏭️ {missed} cycles missed — catching up with {utc(latest)} only")
+            else:
+                for gap in range(missed - 1):
+                    log(f"⛔ Gap: no cycle for {utc(boundary + gap * self.interval)}")
+                log(f"⏪ Catching up with {utc(latest)}")
+            boundary = latest
+
+        self.push_cycle(next_boundary(boundary, self.interval, self.offset))
+        results = fusion_cycle(self.assets, cycle_utc=iso(boundary))
+        self.schedule_recovery(low_integrity(results), attempt=1)
+        log(f"Next cycle at {utc(self.next_cycle)}", event="next_cycle", next_cycle_utc=iso(self.next_cycle))
+
+    def on_recover(self, payload):
+        assets, attempt = payload
+        results = recover(assets)
+        self.schedule_recovery(low_integrity(results), attempt + 1)
+
+    def schedule_recovery(self, assets, attempt):
+        if not assets:
+            return
+        if attempt > config.RECOVERY_MAX_ATTEMPTS:
+            log(f"⚠️ Recovery gave up on {', '.join(assets)} after {config.RECOVERY_MAX_ATTEMPTS} attempts")
+            return
+        delay = min(config.RECOVERY_BASE_SECONDS * 2 ** (attempt - 1), config.RECOVERY_MAX_SECONDS)
+        when = time.time() + delay
+        if self.next_cycle is not None and when >= self.next_cycle:
+            log(f"⚠️ Recovery for {', '.join(assets)} deferred to the next cycle")
+            return
+        log(f"⚠️ Data integrity low for {', '.join(assets)} — recovery attempt {attempt} in {delay}s")
+        self.push(when, "recover", (assets, attempt))
+
+    # ==============================
+    # 🕒 LOOP
+    # ==============================
+    def run_once(self):
+        when, _, kind, payload = heapq.heappop(self.queue)
+        sleep_until(when)
+        if kind == "cycle":
+            self.on_cycle(payload)
+        else:
+            self.on_recover(payload)
+
+    def start(self, immediate=True):
+        """Queue the first cycle: the current boundary right away, or wait for the next one."""
+        now = time.time()
+        if immediate:
+            self.push(now, "cycle", None)
+        else:
+            self.push_cycle(next_boundary(now, self.interval, self.offset))
+
+    def run_forever(self, immediate=True):
+        self.start(immediate)
+        while True:
+            self.run_once()
+
+
+def continuous_runtime(assets=None, **options):
+    CycleScheduler(assets, **options).run_forever()
@@ -0,0 +1,256 @@
+# =========================================================
+# fusion_engine/store.py
+# =========================================================
+# ✅ Append-only per-asset store for M1–M7 cycle outputs
+# ✅ Monthly JSONL segments, one flat row per cycle ("M6.risk_chain_score": ...);
+#    a republished cycle (autorecovery) supersedes the earlier row on read
+# ✅ Time index per asset so range queries only open overlapping segments;
+#    appends never rewrite it, readers catch it up from the segment tails
+# ✅ Compaction folds legacy TOTAL_RECALL_RUNTIME_*.json files into segments
+# =========================================================
+
+import datetime, glob, json, os, re
+
+from . import config
+from .logs import log
+
+LEGACY_PATTERN = "TOTAL_RECALL_RUNTIME_*.json"
+LEGACY_STAMP = re.compile(r"TOTAL_RECALL_RUNTIME_(\d{8}_\d{6})\.json$")
+
+
+# ==============================
+# 🕒 TIME
+# ==============================
+def to_epoch(value):
+    """Epoch seconds from a datetime, an ISO string ("...Z" allowed) or a number."""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value.rstrip("Z"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value.timestamp()
+
+def since(days):
+    return datetime.datetime.now(datetime.timezone.utc).timestamp() - days * 86400
+
+def segment_for(t):
+    return datetime.datetime.fromtimestamp(t, datetime.timezone.utc).strftime("%Y-%m")
+
+# ==============================
+# 🧱 ROWS
+# ==============================
+def to_row(output):
+    """Flatten a published cycle output into one store row."""
+    cycle_utc = output.get("cycle_utc") or output["timestamp_utc"]
+    row = {"t": to_epoch(cycle_utc), "cycle_utc": cycle_utc, "timestamp_utc": output["timestamp_utc"]}
+    for module, values in output.get("modules", {}).items():
+        for key, value in values.items():
+            row[f"{module}.{key}"] = value
+    return row
+
+def to_output(row):
+    """Inverse of to_row — the original {"timestamp_utc", "cycle_utc", "modules"} shape."""
+    modules = {}
+    for column, value in row.items():
+        if "." in column:
+            module, key = column.split(".", 1)
+            modules.setdefault(module, {})[key] = value
+    return {"timestamp_utc": row["timestamp_utc"], "cycle_utc": row["cycle_utc"], "modules": modules}
+
+def encode(row):
+    return (json.dumps(row, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+# ==============================
+# 🗂️ SEGMENTS + INDEX
+# ==============================
+def store_path(asset, *parts):
+    path = config.asset_path(asset, config.STORE_DIR)
+    os.makedirs(path, exist_ok=True)
+    return os.path.join(path, *parts)
+
+def segment_path(asset, segment):
+    return store_path(asset, f"{segment}.jsonl")
+
+def read_index(asset):
+    """Segment time ranges, first catching up on rows appended since the index was written.
+
+    Appends never touch the index; each entry records how many bytes of its
+    segment it covers, so a read only scans the tail past that offset.
+    """
+    try:
+        with open(store_path(asset, "index.json"), encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return rebuild_index(asset)
+    changed = False
+    for path in glob.glob(store_path(asset, "*.jsonl")):
+        segment = os.path.basename(path)[:-len(".jsonl")]
+        entry = index.get(segment)
+        size = os.path.getsize(path)
+        if entry is not None and entry.get("bytes") == size:
+            continue
+        if entry is None or entry.get("bytes", size + 1) > size:
+            entry = None  # new, rewritten, or indexed before offsets were recorded
+        entry = scan_segment(path, entry)
+        if entry is not None:
+            index[segment] = entry
+            changed = True
+    if changed:
+        write_index(asset, index)
+    return index
+
+def write_index(asset, index):
+    path = store_path(asset, "index.json")
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+def scan_segment(path, entry=None):
+    """Extend an index entry with the complete rows past entry["bytes"] (whole segment if entry is None)."""
+    entry = dict(entry) if entry else {"first": None, "last": None, "rows": 0, "sorted": True, "bytes": 0}
+    try:
+        with open(path, "rb") as f:
+            f.seek(entry["bytes"])
+            tail = f.read()
+    except OSError:
+        return None
+    end = tail.rfind(b"\n") + 1  # a torn last line is picked up once it is complete
+    for line in tail[:end].splitlines():
+        try:
+            t = json.loads(line)["t"]
+        except (ValueError, KeyError, TypeError):
+            continue  # torn line from a crash mid-append
+        if entry["rows"]:
+            entry["sorted"] = entry["sorted"] and t >= entry["last"]
+            entry["first"], entry["last"] = min(entry["first"], t), max(entry["last"], t)
+        else:
+            entry["first"] = entry["last"] = t
+        entry["rows"] += 1
+    entry["bytes"] += end
+    return entry if entry["rows"] else None
+
+def rebuild_index(asset):
+    """Rescan every segment; used when the index is missing or after compaction."""
+    index = {}
+    for path in sorted(glob.glob(store_path(asset, "*.jsonl"))):
+        entry = scan_segment(path)
+        if entry is not None:
+            index[os.path.basename(path)[:-len(".jsonl")]] = entry
+    write_index(asset, index)
+    return index
+
+def read_segment(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue  # torn tail from a crash mid-append
+    except OSError:
+        return
+
+def append(asset, output):
+    """Append one published cycle output (a single O_APPEND write); returns the segment path."""
+    row = to_row(output)
+    path = segment_path(asset, segment_for(row["t"]))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(fd, encode(row))
+    finally:
+        os.close(fd)
+    return path
+
+# ==============================
+# 🔎 RANGE QUERIES
+# ==============================
+def latest(rows):
+    """One row per cycle from rows in time order: the last published (latest timestamp_utc) wins."""
+    pending = None
+    for row in rows:
+        if pending is not None and row["t"] != pending["t"]:
+            yield pending
+            pending = None
+        if pending is None or row["timestamp_utc"] >= pending["timestamp_utc"]:
+            pending = row
+    if pending is not None:
+        yield pending
+
+def _rows(asset, start, end):
+    for segment, entry in sorted(read_index(asset).items()):
+        if start is not None and entry["last"] < start:
+            continue
+        if end is not None and entry["first"] >= end:
+            break
+        rows = read_segment(segment_path(asset, segment))
+        if not entry["sorted"]:
+            rows = sorted(rows, key=lambda r: r["t"])
+        for row in rows:
+            if start is not None and row["t"] < start:
+                continue
+            if end is not None and row["t"] >= end:
+                break
+            yield row
+
+def read(asset, start=None, end=None):
+    """Rows with start <= t < end in time order, one per cycle, opening only overlapping segments."""
+    return latest(_rows(asset, to_epoch(start), to_epoch(end)))
+
+def columns(asset, names, start=None, end=None):
+    """Column-oriented slice: {"t": [...], "cycle_utc": [...], name: [...]} (None where absent)."""
+    out = {"t": [], "cycle_utc": [], **{name: [] for name in names}}
+    for row in read(asset, start, end):
+        out["t"].append(row["t"])
+        out["cycle_utc"].append(row["cycle_utc"])
+        for name in names:
+            out[name].append(row.get(name))
+    return out
+
+def series(asset, column, start=None, end=None, days=None):
+    """[(cycle_utc, value)] for one column, e.g. series("US30", "M6.risk_chain_score", days=90)."""
+    if days is not None:
+        start = since(days)
+    return [(row["cycle_utc"], row[column]) for row in read(asset, start, end) if column in row]
+
+# ==============================
+# 🧹 COMPACTION
+# ==============================
+def legacy_output(path):
+    with open(path, encoding="utf-8") as f:
+        output = json.load(f)
+    if "timestamp_utc" not in output:
+        stamp = LEGACY_STAMP.search(os.path.basename(path))
+        output["timestamp_utc"] = datetime.datetime.strptime(stamp.group(1), "%Y%m%d_%H%M%S").isoformat() + "Z"
+    return output
+
+def compact(asset, remove=False):
+    """Fold legacy per-cycle JSON files into the segments; returns the number folded."""
+    paths = sorted(glob.glob(config.asset_path(asset, LEGACY_PATTERN)))
+    by_segment, folded = {}, []
+    for path in paths:
+        try:
+            row = to_row(legacy_output(path))
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            log(f"⚠️ Store compaction skipped {os.path.basename(path)}: {e}", asset)
+            continue
+        by_segment.setdefault(segment_for(row["t"]), []).append(row)
+        folded.append(path)
+
+    for segment, rows in by_segment.items():
+        path = segment_path(asset, segment)
+        merged = list(latest(sorted([*read_segment(path), *rows], key=lambda r: r["t"])))
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.writelines(encode(row) for row in merged)
+        os.replace(tmp, path)
+    if by_segment:
+        rebuild_index(asset)
+
+    if remove:
+        for path in folded:
+            os.remove(path)
+    log(f"🧹 Store compaction {asset}: {len(folded)} legacy files into {len(by_segment)} segments"
+        f"{' (removed)' if remove else ''}", asset)
+    return len(folded)
@@ -0,0 +1,73 @@
+# =========================================================
+# fusion_engine/stub.py
+# =========================================================
+# ✅ Local HTTP stand-in for every provider, fed by the fixture archive
+# ✅ Real sockets + keep-alive, so pooling and retries are exercised too
+# ✅ python -m fusion_engine.stub [--port 8765] [--latency ..] [--fail ..]
+# =========================================================
+
+import argparse, json, threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from . import config, replay
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _serve(self, method):
+        host, _, rest = self.path.lstrip("/").partition("/")
+        url = f"https://{host}/{rest}"
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+
+        key = replay.request_key(method, url, body)
+        if replay.inject(host, key):
+            return self._send(503, "application/json", '{"error": "injected failure"}')
+        entry = replay.archive().next(key)
+        if entry is None:
+            return self._send(404, "application/json", json.dumps({"error": f"no fixture for {replay.normalize(url)}"}))
+        self._send(entry["status"], entry.get("content_type") or "application/json", entry["body"])
+
+    def _send(self, status, content_type, text):
+        data = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self._serve("GET")
+
+    def do_POST(self):
+        self._serve("POST")
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(host="127.0.0.1", port=0):
+    """Start the stub in a daemon thread; returns (server, base_url)."""
+    server = ThreadingHTTPServer((host, port), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fusion-stub", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="fusion_engine.stub", description="Serve recorded provider fixtures over HTTP")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", default=config.FIXTURE_DIR)
+    parser.add_argument("--latency", default=config.REPLAY_LATENCY, help='seconds, e.g. "0.2" or "api.twelvedata.com=1.5,*=0.1"')
+    parser.add_argument("--fail", default=config.REPLAY_FAIL, help="failure rate(s), same syntax as --latency")
+    args = parser.parse_args(argv)
+    config.FIXTURE_DIR, config.REPLAY_LATENCY, config.REPLAY_FAIL = args.fixtures, args.latency, args.fail
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), StubHandler)
+    print(f"🧪 Provider stub on http://127.0.0.1:{args.port} serving {args.fixtures}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# =========================================================
+# fusion_engine/transport.py
+# =========================================================
+# ✅ Shared keep-alive sessions, one connection pool per host
+# ✅ Retry + exponential backoff on 429 / 5xx / connection errors
+# ✅ Record / replay / stub routing for offline runs (replay.py)
+# =========================================================
+
+import threading, time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import config, replay
+
+_sessions = {}
+_lock = threading.Lock()
+
+
+def _build_session(base):
+    retry = Retry(
+        total=config.HTTP_RETRIES,
+        backoff_factor=config.HTTP_BACKOFF_FACTOR,
+        status_forcelist=config.HTTP_RETRY_STATUSES,
+        allowed_methods=None,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=config.HTTP_POOL_MAXSIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount(base, adapter)
+    return session
+
+def session_for(url):
+    """Keep-alive session dedicated to the url's scheme://host."""
+    parts = urlsplit(url)
+    base = f"{parts.scheme}://{parts.netloc}"
+    with _lock:
+        if base not in _sessions:
+            _sessions[base] = _build_session(base)
+        return _sessions[base]
+
+def request(method, url, **kwargs):
+    """Every provider call; honours FUSION_REPLAY (record | replay | stub)."""
+    kwargs.setdefault("timeout", config.REQUEST_TIMEOUT)
+    mode = config.REPLAY_MODE
+    if mode == "replay":
+        return replay.respond(method, url, kwargs.get("json"))
+    target = replay.stub_url(url) if mode == "stub" else url
+    started = time.monotonic()
+    response = getattr(session_for(target), method.lower())(target, **kwargs)
+    if mode == "record":
+        replay.record(method, url, kwargs.get("json"), response, time.monotonic() - started)
+    return response
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
+
+def close_all():
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
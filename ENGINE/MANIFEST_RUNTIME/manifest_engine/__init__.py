@@ -0,0 +1,7 @@
+"""Catalog and integrity tooling over the JSON manifest tree."""
+
+from .blobs import BlobStore
+from .catalog import Catalog, load
+from .checksum import Digests, verify_checksums
+from .graph import PathGraph, auto_repair_reference, validate_all_paths
+from .loader import Parsed, document, load as load_manifest
@@ -0,0 +1,109 @@
+# =========================================================
+# python -m manifest_engine [FIELD=VALUE ...] | --paths | --repair SRC | --checksums | --dupes | --snapshot NAME
+# =========================================================
+
+import argparse, json, time
+
+from . import blobs, catalog, checksum, config, graph
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="manifest_engine", description="Manifest tree catalog")
+    parser.add_argument("where", nargs="*", metavar="FIELD=VALUE",
+                        help='filters, e.g. tier=9 protocol=HASHLOCK_v4_TRUTH_CORE refs=/CORE/FUSION_CELL_LAW.json')
+    parser.add_argument("--root", default=config.ROOT, help="manifest tree (default: %(default)s)")
+    parser.add_argument("--rebuild", action="store_true", help="ignore the saved catalog and re-read every file")
+    parser.add_argument("--errors", action="store_true", help="list files that did not parse")
+    parser.add_argument("--paths", action="store_true",
+                        help="validate_all_paths(): resolve every path reference and list the broken ones")
+    parser.add_argument("--repair", metavar="SRC",
+                        help="auto_repair_reference(): show canonical rewrites for one manifest (see --write)")
+    parser.add_argument("--write", action="store_true", help="with --repair, rewrite the file")
+    parser.add_argument("--fuzzy", action="store_true", help="with --repair, also rewrite fuzzy (basename) matches")
+    parser.add_argument("--checksums", action="store_true",
+                        help="verify recorded sha256 values (selfchecks, checksum reports) against the files")
+    parser.add_argument("--report", metavar="FILE", help="with --checksums, also write the full report here")
+    parser.add_argument("--dupes", action="store_true",
+                        help="list paths sharing one blob, and blobs stored as deltas of another")
+    parser.add_argument("--snapshot", metavar="NAME", help="store the tree in the blob store as snapshot NAME")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    cat = catalog.Catalog(args.root)
+    if not args.rebuild:
+        cat.load()
+    if args.dupes or args.snapshot:
+        cat.refresh()
+        store = blobs.BlobStore(cat)
+        if not args.rebuild:
+            store.load()
+        if args.snapshot:
+            report = store.snapshot(args.snapshot)
+        else:
+            store.sync()
+            for sha, paths in sorted(store.groups().items(), key=lambda kv: kv[1]):
+                print(json.dumps({"sha256": sha, "size": store.blobs[sha]["size"], "paths": paths}))
+            by_sha = {e["sha256"]: e["path"] for e in cat}
+            for sha, blob in sorted(store.blobs.items(), key=lambda kv: by_sha.get(kv[0], "")):
+                if blob["kind"] == "delta" and sha in by_sha:
+                    print(json.dumps({"sha256": sha, "path": by_sha[sha], "delta_of": by_sha.get(blob["base"]),
+                                      "size": blob["size"], "stored": blob["stored"]}))
+            report = store.stats()
+        report["seconds"] = round(time.perf_counter() - started, 4)
+        print("# " + json.dumps(report))
+        return
+    if args.checksums:
+        digests = checksum.Digests(cat)
+        if not args.rebuild:
+            digests.load()
+        report = checksum.verify_checksums(catalog=cat, digests=digests)
+        if args.report:
+            with open(args.report, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+        for row in report.pop("diff"):
+            print(json.dumps(row, ensure_ascii=False))
+        report["seconds"] = round(time.perf_counter() - started, 4)
+        print("# " + json.dumps(report))
+        return
+    if args.paths or args.repair:
+        g = graph.PathGraph(cat)
+        if not args.rebuild:
+            g.load()
+        if args.repair:
+            fixes = graph.auto_repair_reference(args.repair, graph=g, write=args.write, fuzzy=args.fuzzy)
+            for old, new in g.repairs(args.repair).get(args.repair, {}).items():
+                print(f"{old} → {new}" + ("" if old in fixes else "  (fuzzy: --fuzzy to rewrite)"))
+            return
+        report = graph.validate_all_paths(graph=g)
+        for broken in report.pop("broken"):
+            print(json.dumps(broken, ensure_ascii=False))
+        report["repairs"] = sum(len(v) for v in report["repairs"].values())
+        report["seconds"] = round(time.perf_counter() - started, 4)
+        print("# " + json.dumps(report))
+        return
+
+    changed = cat.refresh()
+    ready = time.perf_counter()
+
+    where = {}
+    for item in args.where:
+        key, sep, value = item.partition("=")
+        if not sep:
+            parser.error(f"expected FIELD=VALUE, got {item!r}")
+        where[key] = value
+    if "tier" in where:
+        where["tier"] = catalog.tier_level(where["tier"])
+    if args.errors:
+        where["error"] = lambda e: e is not None
+    rows = cat.query(**where) if where else list(cat)
+    done = time.perf_counter()
+
+    for entry in rows:
+        print(json.dumps({k: entry[k] for k in ("path", "identifier", "document_type", "version", "tier",
+                                                "protocol", "error") if entry.get(k) is not None},
+                         ensure_ascii=False))
+    print(f"# {len(rows)}/{len(cat)} manifests | {len(changed)} re-read | "
+          f"catalog {1000 * (ready - started):.1f} ms | query {1000 * (done - ready):.2f} ms")
+
+if __name__ == "__main__":
+    main()
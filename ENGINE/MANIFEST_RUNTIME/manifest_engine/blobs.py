@@ -0,0 +1,219 @@
+# =========================================================
+# manifest_engine/blobs.py
+# =========================================================
+# ✅ Content-addressed store: logical path → sha256 (the catalog) → one blob
+# ✅ Identical manifests are stored once; near-duplicates as line deltas
+#    against a full blob (never against another delta: one patch to read)
+# ✅ Snapshots are {path: sha256} maps over the store
+# =========================================================
+
+import difflib, hashlib, json, os, threading, zlib
+from collections import defaultdict
+
+from . import catalog as catalog_mod, config
+
+FORMAT = 1
+
+
+# ==============================
+# ✂️ LINE DELTAS
+# ==============================
+def sketch(data, k=config.BLOB_SKETCH):
+    """Bottom-k of the line hashes: enough to estimate line overlap between two blobs."""
+    return sorted({zlib.crc32(line) for line in data.splitlines()})[:k]
+
+def similarity(a, b, k=config.BLOB_SKETCH, floor=0.0):
+    """Estimated Jaccard overlap of two sketches' line sets (0 if it cannot reach floor)."""
+    a, b = set(a), set(b)
+    both, union = a & b, a | b
+    if not union:
+        return 1.0
+    if len(both) < floor * min(k, len(union)):  # at most len(both) of the k smallest are shared
+        return 0.0
+    smallest = sorted(union)[:k]
+    return sum(1 for h in smallest if h in both) / len(smallest)
+
+def make_delta(base, data):
+    """Ops rebuilding data from base: [i, j] copies base lines i:j, a string inserts text."""
+    old, new = base.splitlines(True), data.splitlines(True)
+    ops = []
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, old, new, autojunk=False).get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append(b"".join(new[j1:j2]).decode("latin-1"))  # latin-1 round-trips any byte
+    return ops
+
+def apply_delta(base, ops):
+    old = base.splitlines(True)
+    return b"".join(b"".join(old[op[0]:op[1]]) if isinstance(op, list) else op.encode("latin-1") for op in ops)
+
+# ==============================
+# 🧱 STORE
+# ==============================
+class BlobStore:
+    """Blobs for one tree, under CACHE_DIR next to its catalog.
+
+    index.json keeps, per sha256: size, kind ("full" / "delta"), base for
+    deltas, stored bytes, and a line sketch for full blobs.
+    """
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.dir = os.path.join(os.path.dirname(catalog.path), config.BLOB_DIR)
+        self.blobs = {}
+        self.lock = threading.RLock()
+
+    def _object(self, sha):
+        return os.path.join(self.dir, "objects", sha[:2], sha[2:])
+
+    def load(self):
+        try:
+            with open(os.path.join(self.dir, "index.json"), encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved.get("format") == FORMAT:
+                self.blobs = saved["blobs"]
+        except (OSError, ValueError, KeyError):
+            self.blobs = {}
+        return self
+
+    def save(self):
+        os.makedirs(self.dir, exist_ok=True)
+        path = os.path.join(self.dir, "index.json")
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"format": FORMAT, "blobs": self.blobs}, f)
+        os.replace(tmp, path)
+
+    def _write(self, sha, payload):
+        path = self._object(sha)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+        return len(payload)
+
+    def _base_for(self, data, sk):
+        """Most similar full blob of comparable size, if similar enough to delta against."""
+        best, score = None, config.BLOB_DELTA_SIMILARITY
+        for sha, blob in self.blobs.items():
+            if blob["kind"] != "full" or not (len(data) / 2 <= blob["size"] <= 2 * len(data)):
+                continue
+            s = similarity(sk, blob["sketch"], floor=score)
+            if s >= score:
+                best, score = sha, s
+        return best
+
+    def put(self, data, sha=None):
+        """Store bytes once; returns their sha256."""
+        sha = sha or hashlib.sha256(data).hexdigest()
+        with self.lock:
+            if sha in self.blobs:
+                return sha
+            full = zlib.compress(data)
+            sk = sketch(data)
+            base = self._base_for(data, sk)
+            if base is not None:
+                base_data = self.get(base)
+                ops = make_delta(base_data, data)
+                delta = zlib.compress(json.dumps({"base": base, "ops": ops}).encode("utf-8"))
+                if len(delta) < config.BLOB_DELTA_MAX_RATIO * len(full) and apply_delta(base_data, ops) == data:
+                    self.blobs[sha] = {"size": len(data), "kind": "delta", "base": base,
+                                       "stored": self._write(sha, delta)}
+                    return sha
+            self.blobs[sha] = {"size": len(data), "kind": "full", "stored": self._write(sha, full), "sketch": sk}
+            return sha
+
+    def get(self, sha):
+        blob = self.blobs.get(sha)
+        if blob is None:
+            raise KeyError(sha)
+        with open(self._object(sha), "rb") as f:
+            payload = zlib.decompress(f.read())
+        if blob["kind"] == "full":
+            return payload
+        delta = json.loads(payload)
+        return apply_delta(self.get(delta["base"]), delta["ops"])
+
+    def __contains__(self, sha):
+        return sha in self.blobs
+
+    # ==============================
+    # 🌳 TREE
+    # ==============================
+    def groups(self):
+        """{sha256: [paths]} for every blob the tree holds under more than one path."""
+        by_sha = defaultdict(list)
+        for rel, entry in self.catalog.entries.items():
+            by_sha[entry["sha256"]].append(rel)
+        return {sha: sorted(paths) for sha, paths in by_sha.items() if len(paths) > 1}
+
+    def sync(self):
+        """Store every blob the catalog knows, reading one path per unique sha256; returns the new shas."""
+        with self.lock:
+            added = []
+            by_sha = {}
+            for rel, entry in sorted(self.catalog.entries.items()):
+                by_sha.setdefault(entry["sha256"], rel)
+            # Larger blobs first, so their smaller near-copies find them as bases.
+            for sha, rel in sorted(by_sha.items(), key=lambda kv: -self.catalog.entries[kv[1]]["size"]):
+                if sha in self.blobs:
+                    continue
+                with open(os.path.join(self.catalog.root, rel), "rb") as f:
+                    data = f.read()
+                if hashlib.sha256(data).hexdigest() != sha:
+                    continue  # changed since the catalog saw it; the next refresh picks it up
+                self.put(data, sha)
+                added.append(sha)
+            if added:
+                self.save()
+            return added
+
+    def snapshot(self, name):
+        """Record the tree as {path: sha256} under snapshots/<name>.json; returns the stats."""
+        self.catalog.refresh()
+        self.sync()
+        files = {rel: entry["sha256"] for rel, entry in sorted(self.catalog.entries.items())}
+        path = os.path.join(self.dir, "snapshots", f"{name}.json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"root": self.catalog.root, "files": files}, f, indent=1)
+        return self.stats(files)
+
+    def snapshot_files(self, name):
+        with open(os.path.join(self.dir, "snapshots", f"{name}.json"), encoding="utf-8") as f:
+            return json.load(f)["files"]
+
+    def restore(self, name, dest):
+        """Write a snapshot's files under dest; each blob is decoded once however many paths share it."""
+        files = self.snapshot_files(name)
+        by_sha = defaultdict(list)
+        for rel, sha in files.items():
+            by_sha[sha].append(rel)
+        for sha, rels in by_sha.items():
+            data = self.get(sha)
+            for rel in rels:
+                path = os.path.join(dest, rel)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "wb") as f:
+                    f.write(data)
+        return len(files)
+
+    def stats(self, files=None):
+        files = files if files is not None else {rel: e["sha256"] for rel, e in self.catalog.entries.items()}
+        shas = set(files.values())
+        blobs = [self.blobs[sha] for sha in shas if sha in self.blobs]
+        return {
+            "paths": len(files),
+            "blobs": len(shas),
+            "deltas": sum(1 for b in blobs if b["kind"] == "delta"),
+            "logical_bytes": sum(self.blobs[sha]["size"] for sha in files.values() if sha in self.blobs),
+            "unique_bytes": sum(b["size"] for b in blobs),
+            "stored_bytes": sum(b["stored"] for b in blobs),
+        }
+
+def open_store(root=config.ROOT, catalog=None):
+    if catalog is None:
+        catalog = catalog_mod.Catalog(root).load()
+    return BlobStore(catalog).load()
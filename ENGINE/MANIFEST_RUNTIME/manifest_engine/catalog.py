@@ -0,0 +1,245 @@
+# =========================================================
+# manifest_engine/catalog.py
+# =========================================================
+# ✅ Persistent catalog of every manifest in the tree (parsed via loader)
+# ✅ identifier / document_type / version / tier / protocol / refs / mtime / sha256
+# ✅ Incremental refresh: only files whose (mtime, size) changed are re-read,
+#    and identical content (same sha256) is parsed once
+# ✅ Warm start from disk; queries run over the in-memory entries
+# =========================================================
+
+import hashlib, json, os, re, threading
+
+from . import config, loader
+
+FORMAT = 5
+TIER_LEVEL = re.compile(r"(\d+(?:\.\d+)?)")
+# No whitespace: "Load AZORI_T9_Fusion_Index.json" is prose, searched with REF_INLINE instead.
+REF_WHOLE = re.compile(r"/?(?:[\w.\-]+/)*[\w.\-]+\.json")
+REF_INLINE = re.compile(r"/?(?:[\w.\-]+/)*[\w.\-]+\.json\b")
+SHA256 = re.compile(r"(?:sha-?256:{1,2})?([0-9a-f]{64})", re.I)
+
+
+# ==============================
+# 🔎 FIELD EXTRACTION
+# ==============================
+def field(doc, keys):
+    if not isinstance(doc, dict):
+        return None
+    sections = [doc] + [doc[s] for s in config.FIELD_SECTIONS if isinstance(doc.get(s), dict)]
+    for key in keys:
+        for section in sections:
+            value = section.get(key)
+            if value is not None and not isinstance(value, (dict, list)):
+                return value
+    return None
+
+def tier_level(tier):
+    """9, "9A+", "T9.5A", "Tier-9A" → 9, 9, 9.5, 9 (None when there is no number)."""
+    if isinstance(tier, bool) or tier is None:
+        return None
+    if isinstance(tier, (int, float)):
+        return tier
+    m = TIER_LEVEL.search(str(tier))
+    return float(m.group(1)) if m and "." in m.group(1) else int(m.group(1)) if m else None
+
+def references(doc):
+    """Every string leaf that names a .json file, as written (e.g. "/CORE/FUSION_CELL_LAW.json")."""
+    refs, stack = set(), [doc]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, str) and ".json" in node:
+            text = node.strip()
+            if REF_WHOLE.fullmatch(text):
+                refs.add(text)
+            else:
+                refs.update(REF_INLINE.findall(text))
+    return sorted(refs)
+
+def checksums(doc):
+    """Recorded sha256 values: [{"key": dotted path, "digest", "target": file named beside it or None}].
+
+    A selfcheck key always targets the file it sits in (target None, "self": True).
+    """
+    found, stack = [], [((), doc)]
+    while stack:
+        path, node = stack.pop()
+        if isinstance(node, list):
+            stack.extend((path + (str(i),), v) for i, v in enumerate(node))
+        if not isinstance(node, dict):
+            continue
+        for key, value in node.items():
+            m = SHA256.fullmatch(value.strip()) if key in config.CHECKSUM_KEYS and isinstance(value, str) else None
+            if m is None:
+                stack.append((path + (key,), value))
+                continue
+            claim = {"key": ".".join(path + (key,)), "digest": m.group(1).lower(), "target": None}
+            if key in config.SELFCHECK_KEYS:
+                claim["self"] = True
+            else:
+                claim["target"] = next((node[k] for k in config.CHECKSUM_TARGET_KEYS
+                                        if isinstance(node.get(k), str) and node[k].strip()), None)
+            found.append(claim)
+    return sorted(found, key=lambda c: c["key"])
+
+def describe(path, rel, stat=None, known=None):
+    """Catalog entry for one file.
+
+    known maps sha256 → an entry already described; identical content is not parsed twice.
+    """
+    stat = stat or os.stat(path)
+    with open(path, "rb") as f:
+        data = f.read()
+    entry = {"path": rel, "mtime": stat.st_mtime, "size": stat.st_size,
+             "sha256": hashlib.sha256(data).hexdigest()}
+    twin = (known or {}).get(entry["sha256"])
+    if twin is not None:
+        entry.update((k, v) for k, v in twin.items() if k not in entry)
+        return entry
+    parsed = loader.load(path, stat, data)
+    docs = parsed.documents
+    entry["error"] = parsed.error
+    entry["documents"] = len(docs)
+    entry["preamble"] = bool(parsed.preamble.strip())
+    for name, keys in config.FIELD_KEYS.items():
+        entry[name] = next((v for v in (field(d, keys) for d in docs) if v is not None), None)
+    entry["tier_level"] = tier_level(entry["tier"])
+    entry["refs"] = references(docs)
+    entry["checksums"] = checksums(parsed.doc)
+    # Bundles declare each embedded document's own path on the line above it.
+    entry["embedded"] = [line for line in (label.splitlines()[-1].strip() if label else "" for label in parsed.labels)
+                         if REF_WHOLE.fullmatch(line)]
+    return entry
+
+# ==============================
+# 🌳 TREE WALK
+# ==============================
+def walk(root=config.ROOT, suffixes=config.SUFFIXES):
+    """{relative posix path: os.stat_result} for every manifest under root (every file if suffixes is None)."""
+    found, stack = {}, [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    if e.name not in config.SKIP_DIRS:
+                        stack.append(e.path)
+                elif suffixes is None or e.name.endswith(suffixes):
+                    found[os.path.relpath(e.path, root).replace(os.sep, "/")] = e.stat()
+    return found
+
+# ==============================
+# 📇 CATALOG
+# ==============================
+class Catalog:
+    """Entries keyed by relative path, persisted under CACHE_DIR per tree root."""
+
+    def __init__(self, root=config.ROOT, path=None):
+        self.root = os.path.abspath(root)
+        digest = hashlib.sha1(self.root.encode("utf-8")).hexdigest()[:12]
+        self.path = path or os.path.join(config.CACHE_DIR, digest, config.CATALOG_FILE)
+        self.entries = {}
+        self.indexes = {}
+        self.lock = threading.Lock()
+
+    def load(self):
+        """Warm start from the saved catalog (empty if missing, corrupt or for another root)."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved.get("format") == FORMAT and saved.get("root") == self.root:
+                self.entries = saved["entries"]
+        except (OSError, ValueError, KeyError):
+            self.entries = {}
+        self.indexes = {}
+        return self
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"format": FORMAT, "root": self.root, "entries": self.entries}, f)
+        os.replace(tmp, self.path)
+
+    def refresh(self, save=True):
+        """Re-describe new/changed files, drop deleted ones; returns the changed paths."""
+        with self.lock:
+            seen = walk(self.root)
+            changed = [rel for rel, st in seen.items()
+                       if rel not in self.entries
+                       or self.entries[rel]["mtime"] != st.st_mtime or self.entries[rel]["size"] != st.st_size]
+            removed = [rel for rel in self.entries if rel not in seen]
+            stale = set(changed)
+            known = {e["sha256"]: e for rel, e in self.entries.items() if rel not in stale and rel in seen}
+            for rel in changed:
+                entry = self.entries[rel] = describe(os.path.join(self.root, rel), rel, seen[rel], known)
+                known.setdefault(entry["sha256"], entry)
+            for rel in removed:
+                del self.entries[rel]
+            if changed or removed:
+                self.indexes = {}
+                if save:
+                    self.save()
+            return sorted(changed + removed)
+
+    # ==============================
+    # 🔍 QUERIES
+    # ==============================
+    def index(self, name):
+        """{value: [entries]} for one field, built on first use."""
+        if name not in self.indexes:
+            idx = {}
+            for entry in self.entries.values():
+                idx.setdefault(entry.get(name), []).append(entry)
+            self.indexes[name] = idx
+        return self.indexes[name]
+
+    def query(self, **where):
+        """Entries matching every filter, by path.
+
+        tier=9 matches on tier_level; refs="/CORE/X.json" is membership;
+        a callable value is a predicate on the field.
+        """
+        if "tier" in where and not callable(where["tier"]):
+            where["tier_level"] = tier_level(where.pop("tier"))
+        exact = {k: v for k, v in where.items() if not callable(v) and k != "refs"}
+        if exact:  # narrow with the smallest exact-match bucket first
+            buckets = [self.index(k).get(v, []) for k, v in exact.items()]
+            candidates = min(buckets, key=len)
+        else:
+            candidates = self.entries.values()
+        out = []
+        for entry in candidates:
+            ok = True
+            for k, v in where.items():
+                value = entry.get(k)
+                if callable(v):
+                    ok = v(value)
+                elif k == "refs":
+                    ok = v in value
+                else:
+                    ok = value == v
+                if not ok:
+                    break
+            if ok:
+                out.append(entry)
+        return sorted(out, key=lambda e: e["path"])
+
+    def get(self, rel):
+        return self.entries.get(rel)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(sorted(self.entries.values(), key=lambda e: e["path"]))
+
+def load(root=config.ROOT, refresh=True):
+    """Catalog warm-started from disk and (by default) brought up to date with the tree."""
+    catalog = Catalog(root).load()
+    if refresh:
+        catalog.refresh()
+    return catalog
@@ -0,0 +1,203 @@
+# =========================================================
+# manifest_engine/checksum.py
+# =========================================================
+# ✅ Verifies recorded sha256 values against the files they describe:
+#    telemetry_ext.sha256_selfcheck, AZORI/CHECKSUM reports (integrity_hash /
+#    manifest_checksum), checksum_verification blocks (computed_hash)
+# ✅ Files read through mmap, hashed in a process pool when there is enough to hash
+# ✅ Digests cached by (path, mtime, size): unchanged files are never rehashed,
+#    and a blob shared by several paths is hashed once
+# ✅ Diff report: ok / mismatch / missing / ambiguous / unbound per recorded value
+# =========================================================
+
+import hashlib, json, mmap, os, posixpath, threading, time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from . import catalog as catalog_mod, config
+
+FORMAT = 1
+ZERO = b"0" * 64
+
+
+# ==============================
+# 🧮 HASHING
+# ==============================
+def digest(path, blanks=()):
+    """(sha256, {hex: sha256 with that hex written as 64 zeros}) for one file.
+
+    A selfcheck cannot contain its own hash, so it is also checked against the
+    file with the recorded value zeroed out.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file: nothing to map
+            empty = hashlib.sha256().hexdigest()
+            return empty, {hexdigest: empty for hexdigest in blanks}
+    with mm, memoryview(mm) as view:
+        full = hashlib.sha256(view).hexdigest()
+        zeroed = {}
+        for hexdigest in blanks:
+            needle, h, pos = hexdigest.encode("ascii"), hashlib.sha256(), 0
+            i = mm.find(needle)
+            while i >= 0:
+                h.update(view[pos:i])
+                h.update(ZERO)
+                pos = i + len(needle)
+                i = mm.find(needle, pos)
+            h.update(view[pos:])
+            zeroed[hexdigest] = h.hexdigest()
+    return full, zeroed
+
+def _digest_job(job):
+    path, blanks = job
+    return digest(path, blanks)
+
+class Digests:
+    """{rel: {"mtime_ns", "size", "sha256", "zeroed"}} persisted next to the catalog."""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.path = os.path.join(os.path.dirname(catalog.path), config.DIGEST_FILE)
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved.get("format") == FORMAT and saved.get("root") == self.catalog.root:
+                self.entries = saved["entries"]
+        except (OSError, ValueError, KeyError):
+            self.entries = {}
+        return self
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"format": FORMAT, "root": self.catalog.root, "entries": self.entries}, f)
+        os.replace(tmp, self.path)
+
+    def _fresh(self, rel, st, blanks):
+        entry = self.entries.get(rel)
+        return (entry is not None and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size
+                and all(b in entry["zeroed"] for b in blanks))
+
+    def update(self, stats, blanks=None, workers=config.CHECKSUM_WORKERS):
+        """Bring digests for {rel: stat} up to date; returns the rels actually hashed.
+
+        A file whose content (the catalog's sha256) was already hashed under
+        another path reuses those digests; the rest are hashed inline, or in a
+        process pool once they add up to CHECKSUM_POOL_MIN_BYTES.
+        """
+        blanks = blanks or {}
+        with self.lock:
+            gone = [r for r in self.entries if r not in stats]
+            for rel in gone:
+                del self.entries[rel]
+            todo, copies, pending, reused = [], [], {}, 0
+            by_content = {e["sha256"]: e for e in self.entries.values()}
+            for rel, st in sorted(stats.items()):
+                need = sorted(blanks.get(rel, ()))
+                if self._fresh(rel, st, need):
+                    continue
+                known = self.catalog.get(rel)
+                sha = known["sha256"] if known and (known["mtime"], known["size"]) == (st.st_mtime, st.st_size) else None
+                if sha is not None:
+                    twin = by_content.get(sha, {"sha256": sha, "zeroed": {}})
+                    if all(b in twin["zeroed"] for b in need):
+                        self.entries[rel] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size,
+                                             "sha256": sha, "zeroed": dict(twin["zeroed"])}
+                        reused += 1
+                        continue
+                    if sha in pending:  # identical to a file hashed in this pass
+                        copies.append((rel, st, pending[sha]))
+                        continue
+                    pending[sha] = rel
+                todo.append((rel, st, need))
+            jobs = [(os.path.join(self.catalog.root, rel), need) for rel, _, need in todo]
+            if workers > 1 and len(jobs) > 1 and sum(st.st_size for _, st, _ in todo) >= config.CHECKSUM_POOL_MIN_BYTES:
+                with ProcessPoolExecutor(min(workers, len(jobs))) as pool:
+                    results = list(pool.map(_digest_job, jobs, chunksize=max(1, len(jobs) // (4 * workers))))
+            else:
+                results = [_digest_job(job) for job in jobs]
+            for (rel, st, _), (full, zeroed) in zip(todo, results):
+                self.entries[rel] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": full, "zeroed": zeroed}
+            for rel, st, first in copies:
+                self.entries[rel] = dict(self.entries[first], mtime_ns=st.st_mtime_ns, size=st.st_size)
+            if todo or gone or copies or reused:
+                self.save()
+            return [rel for rel, _, _ in todo]
+
+    def get(self, rel):
+        return self.entries.get(rel)
+
+# ==============================
+# 🔐 VERIFICATION
+# ==============================
+def _resolve(src, name, by_base):
+    """(rel, status) for the file a checksum names: a tree path, or a basename near src."""
+    clean = name.strip().lstrip("/")
+    if "/" in clean and posixpath.normpath(clean) in by_base.get(posixpath.basename(clean).lower(), ()):
+        return posixpath.normpath(clean), None
+    candidates = by_base.get(posixpath.basename(clean).lower(), [])
+    if len(candidates) > 1:
+        near = [c for c in candidates if posixpath.dirname(c) == posixpath.dirname(src)]
+        candidates = near if len(near) == 1 else candidates
+    if len(candidates) == 1:
+        return candidates[0], None
+    return None, "ambiguous" if candidates else "missing"
+
+def verify_checksums(root=config.ROOT, catalog=None, digests=None):
+    """Check every recorded sha256 in the tree; returns the report dict ("diff" holds every non-ok row)."""
+    started = time.perf_counter()
+    if catalog is None:
+        catalog = catalog_mod.Catalog(root).load()
+    catalog.refresh()
+    digests = digests or Digests(catalog).load()
+    files = catalog_mod.walk(catalog.root, suffixes=None)  # artifacts need not be manifests
+    by_base = defaultdict(list)
+    for rel in files:
+        by_base[posixpath.basename(rel).lower()].append(rel)
+
+    rows, blanks = [], defaultdict(set)
+    for src, entry in sorted(catalog.entries.items()):
+        for claim in entry.get("checksums", ()):
+            row = {"source": src, "key": claim["key"], "named": claim["target"], "target": None,
+                   "recorded": claim["digest"]}
+            if claim.get("self"):
+                row["target"] = src
+                blanks[src].add(claim["digest"])
+            elif claim["target"] is None:
+                row["status"] = "unbound"
+            else:
+                row["target"], status = _resolve(src, claim["target"], by_base)
+                if status:
+                    row["status"] = status
+            rows.append(row)
+
+    targets = {row["target"] for row in rows if row["target"]}
+    hashed = digests.update({rel: files[rel] for rel in targets}, blanks)
+    for row in rows:
+        if "status" in row:
+            continue
+        entry = digests.get(row["target"])
+        row["actual"] = entry["sha256"]
+        if row["recorded"] == entry["sha256"]:
+            row["status"] = "ok"
+        elif row["recorded"] == entry["zeroed"].get(row["recorded"]):
+            row["status"], row["actual"] = "ok", entry["zeroed"][row["recorded"]]
+        else:
+            row["status"] = "mismatch"
+
+    status = Counter(row["status"] for row in rows)
+    return {
+        "recorded": len(rows),
+        "files": len(targets),
+        "rehashed": len(hashed),
+        "status": dict(status),
+        "diff": [row for row in rows if row["status"] != "ok"],
+        "seconds": round(time.perf_counter() - started, 4),
+    }
@@ -0,0 +1,74 @@
+# =========================================================
+# manifest_engine/config.py
+# =========================================================
+# ✅ Where the manifest tree lives and where derived state goes
+# =========================================================
+
+import os
+
+# ==============================
+# 🌳 TREE
+# ==============================
+# Default root: the repository this package sits in (ENGINE/MANIFEST_RUNTIME/..).
+ROOT = os.environ.get("MANIFEST_ROOT", os.path.abspath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..")))
+SUFFIXES = (".json",)
+SKIP_DIRS = {".git", "__pycache__", ".pytest_cache", "node_modules"}
+
+# ==============================
+# 💾 DERIVED STATE
+# ==============================
+# Catalog and caches are rebuilt from the tree, so they live outside it.
+CACHE_DIR = os.environ.get("MANIFEST_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "manifest_engine"))
+CATALOG_FILE = "catalog.json"
+GRAPH_FILE = "path_graph.json"
+DIGEST_FILE = "digests.json"
+BLOB_DIR = "blobs"
+LOADER_CACHE_ENTRIES = 1024  # parsed files kept in memory, keyed by (path, mtime, size)
+
+# ==============================
+# 🏷️ CATALOG FIELDS
+# ==============================
+# Keys are tried in order; each at the top level, then inside the header-like sections.
+FIELD_KEYS = {
+    "identifier": ("identifier", "id", "gpt_id", "module_name", "designation", "name"),
+    "document_type": ("document_type", "type"),
+    "version": ("version",),
+    "tier": ("tier",),
+    "protocol": ("hashlock_protocol", "protocol"),
+}
+FIELD_SECTIONS = ("header", "metadata", "meta", "integrity", "system_instructions")
+
+# ==============================
+# 🧭 PATH RESOLUTION
+# ==============================
+# Legacy top-level folders still named in manifests → where that content lives now.
+PATH_ALIASES = {
+    "AZORI_CORE": "AZORI",
+    "AZORI_RUNTIME": "AZORI",
+    "MNT_CORE": "CORE",
+    "OLD_CORE": "CORE",
+    "ENGINES": "ENGINE",
+    "SIMULATION_ENGINE": "SIMULATION",
+}
+
+# ==============================
+# 🔐 CHECKSUMS
+# ==============================
+# Keys whose value is a recorded sha256 ("<hex>", "sha256:<hex>"), and the sibling
+# keys that name the file it was computed over. sha256_selfcheck is the file itself.
+CHECKSUM_KEYS = ("sha256_selfcheck", "integrity_hash", "manifest_checksum", "computed_hash", "checksum")
+CHECKSUM_TARGET_KEYS = ("file_name", "artifact", "target", "file")
+SELFCHECK_KEYS = ("sha256_selfcheck",)
+CHECKSUM_WORKERS = int(os.environ.get("MANIFEST_CHECKSUM_WORKERS", "0")) or os.cpu_count() or 1
+CHECKSUM_POOL_MIN_BYTES = 8 * 1024 * 1024  # below this, hashing inline beats starting a pool
+
+# ==============================
+# 🧱 BLOB STORE
+# ==============================
+# A new blob is stored as a line delta against the most similar full blob when the
+# estimated line overlap reaches BLOB_DELTA_SIMILARITY and the delta comes out
+# smaller than BLOB_DELTA_MAX_RATIO of the compressed blob.
+BLOB_SKETCH = 64  # line hashes kept per full blob for similarity estimates
+BLOB_DELTA_SIMILARITY = 0.8
+BLOB_DELTA_MAX_RATIO = 0.5
@@ -0,0 +1,246 @@
+# =========================================================
+# manifest_engine/graph.py
+# =========================================================
+# ✅ Directed graph of path references between manifests ("/CORE/FUSION_CELL_LAW.json")
+# ✅ Resolution against the real tree: exact, relative, case, legacy alias,
+#    documents embedded in bundles, flattened DIR/DIR_NAME files, then basename
+#    fuzzy matching
+# ✅ Cached on disk; only edges touched by changed / added / removed files are re-resolved
+# ✅ validate_all_paths() + auto_repair_reference() — the PATH_INTEGRITY runtime hooks
+# =========================================================
+
+import json, os, posixpath, re, threading, time
+from collections import Counter, defaultdict
+
+from . import catalog as catalog_mod, config
+
+FORMAT = 3
+OK = ("ok", "relative", "embedded")
+REPAIRABLE = ("case", "alias", "legacy", "fuzzy")
+REWRITABLE = ("case", "alias", "legacy")  # deterministic; fuzzy hits are only written on request
+BROKEN = ("missing", "ambiguous")
+HOST = re.compile(r"(?:[a-z0-9\-]+\.)+[a-z]{2,}", re.I)
+
+
+def _base_key(path):
+    """Basename folded for fuzzy matching: case, separators and spaces ignored."""
+    return re.sub(r"[^a-z0-9]", "", posixpath.basename(path).lower())
+
+def _external(clean):
+    """True for urls and host-led paths ("raw.githubusercontent.com/..."), not ./ or ../ paths."""
+    if "://" in clean:
+        return True
+    head, sep, _ = clean.lstrip("/").partition("/")
+    return bool(sep) and not head.lower().endswith(".json") and bool(HOST.fullmatch(head))
+
+def _flattened(path):
+    """"CORE/FUSION_CELL_LAW.json" → "CORE/CORE_FUSION_CELL_LAW.json": the tree's legacy layout
+    names every file after its folder."""
+    folder, name = posixpath.split(path)
+    return posixpath.join(folder, f"{posixpath.basename(folder)}_{name}") if folder else None
+
+def _node_keys(catalog):
+    """Every resolvable target: tree paths, plus "#<path>" for documents embedded in bundles."""
+    nodes = set(catalog.entries)
+    for rel, entry in catalog.entries.items():
+        nodes.update("#" + label.lstrip("/") for label in entry.get("embedded", ()))
+    return nodes
+
+# ==============================
+# 🧭 RESOLUTION
+# ==============================
+class Resolver:
+    """Lookup tables over the current tree; rebuilt per update (a few ms)."""
+
+    def __init__(self, catalog):
+        self.paths = set(catalog.entries)
+        self.lower = {p.lower(): p for p in self.paths}
+        self.by_base = defaultdict(list)
+        for p in self.paths:
+            self.by_base[_base_key(p)].append(p)
+        self.embedded = {}
+        for rel, entry in catalog.entries.items():
+            for label in entry.get("embedded", ()):
+                self.embedded.setdefault(label.lstrip("/").lower(), rel)
+
+    def _exact(self, path):
+        if path in self.paths:
+            return path, "ok"
+        if path.lower() in self.lower:
+            return self.lower[path.lower()], "case"
+        return None, None
+
+    def resolve(self, src, ref):
+        """{"ref", "status", "target"[, "candidates"]} for one reference written in src."""
+        clean = ref.strip()
+        head = clean.lstrip("/").split("/", 1)[0]
+        if _external(clean):
+            return {"ref": ref, "status": "external", "target": None}
+        path = posixpath.normpath(clean.lstrip("/")) if clean.lstrip("/") else ""
+
+        target, status = self._exact(path)
+        if target:
+            return {"ref": ref, "status": status, "target": target}
+        if not clean.startswith("/"):
+            target, status = self._exact(posixpath.normpath(posixpath.join(posixpath.dirname(src), path)))
+            if target:
+                return {"ref": ref, "status": "relative" if status == "ok" else status, "target": target}
+        if head in config.PATH_ALIASES:
+            target, _ = self._exact(config.PATH_ALIASES[head] + path[len(head):])
+            if target:
+                return {"ref": ref, "status": "alias", "target": target}
+        if path.lower() in self.embedded:
+            return {"ref": ref, "status": "embedded", "target": self.embedded[path.lower()]}
+        aliased = config.PATH_ALIASES[head] + path[len(head):] if head in config.PATH_ALIASES else None
+        for legacy in (_flattened(path), aliased and _flattened(aliased)):
+            target, _ = self._exact(legacy) if legacy else (None, None)
+            if target:
+                return {"ref": ref, "status": "legacy", "target": target}
+
+        candidates = self.by_base.get(_base_key(path), [])
+        if len(candidates) > 1:
+            # Prefer the candidate sharing the longest tail of folders with the reference.
+            parts = path.lower().split("/")
+            def shared(c):
+                n = 0
+                for a, b in zip(reversed(c.lower().split("/")), reversed(parts)):
+                    if a != b and _base_key(a) != _base_key(b):
+                        break
+                    n += 1
+                return n
+            ranked = sorted(candidates, key=shared, reverse=True)
+            if shared(ranked[0]) == shared(ranked[1]):
+                return {"ref": ref, "status": "ambiguous", "target": None, "candidates": sorted(candidates)}
+            candidates = ranked[:1]
+        if candidates:
+            return {"ref": ref, "status": "fuzzy", "target": candidates[0]}
+        return {"ref": ref, "status": "missing", "target": None}
+
+# ==============================
+# 🕸️ GRAPH
+# ==============================
+class PathGraph:
+    """Resolved outgoing edges per manifest, persisted next to the catalog."""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.path = os.path.join(os.path.dirname(catalog.path), config.GRAPH_FILE)
+        self.edges = {}   # src → {"sha256": ..., "refs": [resolution, ...]}
+        self.nodes = set()
+        self.lock = threading.Lock()
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved.get("format") == FORMAT and saved.get("root") == self.catalog.root:
+                self.edges, self.nodes = saved["edges"], set(saved["nodes"])
+        except (OSError, ValueError, KeyError):
+            self.edges, self.nodes = {}, set()
+        return self
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"format": FORMAT, "root": self.catalog.root, "nodes": sorted(self.nodes),
+                       "edges": self.edges}, f)
+        os.replace(tmp, self.path)
+
+    def update(self):
+        """Re-resolve only the touched subgraph; returns the sources whose edges were redone.
+
+        Touched: manifests whose content or extracted references changed, and
+        every edge whose target basename matches an added or removed file.
+        """
+        with self.lock:
+            entries = self.catalog.entries
+            nodes = _node_keys(self.catalog)
+            appeared_or_gone = {_base_key(n) for n in nodes ^ self.nodes}
+            for src in [s for s in self.edges if s not in entries]:
+                del self.edges[src]
+            touched = {src for src, entry in entries.items()
+                       if src not in self.edges or self.edges[src]["sha256"] != entry["sha256"]
+                       or [r["ref"] for r in self.edges[src]["refs"]] != entry["refs"]}
+            if appeared_or_gone:
+                touched.update(src for src, edge in self.edges.items()
+                               if any(_base_key(r["ref"]) in appeared_or_gone for r in edge["refs"]))
+            if touched:
+                resolver = Resolver(self.catalog)
+                for src in touched:
+                    self.edges[src] = {"sha256": entries[src]["sha256"],
+                                       "refs": [resolver.resolve(src, ref) for ref in entries[src]["refs"]]}
+            if touched or nodes != self.nodes:
+                self.nodes = nodes
+                self.save()
+            return sorted(touched)
+
+    # ==============================
+    # 🔍 QUERIES
+    # ==============================
+    def outbound(self, src):
+        return self.edges.get(src, {}).get("refs", [])
+
+    def inbound(self, target):
+        """[(src, resolution)] for every reference that lands on target."""
+        return [(src, r) for src, edge in sorted(self.edges.items()) for r in edge["refs"] if r["target"] == target]
+
+    def by_status(self, *statuses):
+        return [(src, r) for src, edge in sorted(self.edges.items()) for r in edge["refs"] if r["status"] in statuses]
+
+    def repairs(self, src=None, statuses=REPAIRABLE):
+        """{src: {ref as written: canonical "/<path>"}} for case / alias / legacy / fuzzy hits."""
+        out = defaultdict(dict)
+        for s, r in self.by_status(*statuses):
+            if src is None or s == src:
+                out[s][r["ref"]] = "/" + r["target"]
+        return dict(out)
+
+# ==============================
+# 🩺 RUNTIME HOOKS
+# ==============================
+def open_graph(root=config.ROOT, catalog=None):
+    if catalog is None:  # an empty Catalog is falsy (__len__)
+        catalog = catalog_mod.Catalog(root).load()
+    return PathGraph(catalog).load()
+
+def validate_all_paths(root=config.ROOT, graph=None):
+    """on_sweep_start: refresh catalog + graph, then report every reference by status."""
+    started = time.perf_counter()
+    graph = graph or open_graph(root)
+    changed = graph.catalog.refresh()
+    touched = graph.update()
+    status = Counter(r["status"] for edge in graph.edges.values() for r in edge["refs"])
+    return {
+        "files": len(graph.catalog),
+        "references": sum(status.values()),
+        "status": dict(status),
+        "changed_files": len(changed),
+        "revalidated_sources": len(touched),
+        "broken": [dict(r, source=s) for s, r in graph.by_status(*BROKEN)],
+        "repairs": graph.repairs(),
+        "seconds": round(time.perf_counter() - started, 4),
+    }
+
+def auto_repair_reference(src, root=config.ROOT, graph=None, write=False, fuzzy=False):
+    """on_legacy_ref_detected: rewrite src's case / alias / legacy references to canonical paths.
+
+    Only whole JSON strings equal to the old reference are replaced. Fuzzy
+    (basename) hits are guesses and stay in the validate_all_paths report
+    unless fuzzy=True. Without write=True this is a dry run; returns {old: new}.
+    """
+    graph = graph or open_graph(root)
+    graph.catalog.refresh()
+    graph.update()
+    fixes = graph.repairs(src, REPAIRABLE if fuzzy else REWRITABLE).get(src, {})
+    if fixes and write:
+        path = os.path.join(graph.catalog.root, src)
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        for old, new in fixes.items():
+            text = text.replace(json.dumps(old, ensure_ascii=False), json.dumps(new, ensure_ascii=False))
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    return fixes
@@ -0,0 +1,159 @@
+# =========================================================
+# manifest_engine/loader.py
+# =========================================================
+# ✅ One tolerant loader for every manifest in the tree
+# ✅ Strips non-JSON preambles ("GENESIS" + a path line, "MARKET RISK CHAIN", ...)
+# ✅ Multi-document files (with label lines between them), stray top-level
+#    "key": {...} pairs, "+0.002" numbers
+# ✅ Parsed results cached by (path, mtime, size); orjson when installed
+# =========================================================
+
+import json, os, re, threading
+from collections import OrderedDict
+
+from . import config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# A document starts on a line beginning with "{", "[" or a stray '"key":' pair.
+DOC_START = re.compile(r'^[ \t]*(?:[{\[]|"[^"\n]*"\s*:)', re.M)
+NEXT_DOC = re.compile(r'[{\[]|"[^"\n]*"\s*:')  # after the first, documents may share a line
+SPACE = re.compile(r"[\s,]*")
+PLUS_NUMBER = re.compile(r'(?<=[:\[,])(\s*)\+(?=\d)')
+_decoder = json.JSONDecoder()
+
+
+class Parsed:
+    """Documents of one file plus whatever text surrounded them; treat as read-only.
+
+    labels[i] is the text just before documents[i] (the preamble for the
+    first); bundles like the path integrity log put each document's path there.
+    """
+
+    __slots__ = ("documents", "labels", "preamble", "trailer", "error")
+
+    def __init__(self, documents=(), preamble="", trailer="", error=None, labels=None):
+        self.documents = list(documents)
+        self.labels = labels if labels is not None else [preamble.strip()] + [""] * (len(self.documents) - 1)
+        self.preamble = preamble
+        self.trailer = trailer
+        self.error = error
+
+    @property
+    def doc(self):
+        """The document, or None; several documents come back as a list."""
+        if not self.documents:
+            return None
+        return self.documents[0] if len(self.documents) == 1 else self.documents
+
+    def __repr__(self):
+        return (f"Parsed({len(self.documents)} docs, preamble={self.preamble[:30]!r}, "
+                f"error={self.error!r})")
+
+# ==============================
+# 🧩 PARSING
+# ==============================
+def _loads(text):
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+def _documents(text):
+    """Decode back-to-back documents; returns (documents, labels, trailer)."""
+    docs, labels, pos, label = [], [], 0, ""
+    while True:
+        pos = SPACE.match(text, pos).end()
+        if pos >= len(text):
+            return docs, labels, ""
+        if not NEXT_DOC.match(text, pos):
+            # A label line (e.g. the next document's path) or prose after the last document.
+            m = DOC_START.search(text, pos)
+            if m is None:
+                return docs, labels, text[pos:]
+            label, pos = text[pos:m.start()].strip(), m.start()
+            continue
+        labels.append(label)
+        label = ""
+        if text[pos] == '"':  # stray top-level "key": value
+            key, pos = _decoder.raw_decode(text, pos)
+            pos = SPACE.match(text, pos).end()
+            if text[pos:pos + 1] != ":":
+                raise ValueError(f"expected ':' after top-level key at char {pos}")
+            value, pos = _decoder.raw_decode(text, SPACE.match(text, pos + 1).end())
+            docs.append({key: value})
+        else:
+            doc, pos = _decoder.raw_decode(text, pos)
+            docs.append(doc)
+
+def parse_text(text):
+    if not text.strip():
+        return Parsed(error="empty file")
+    m = DOC_START.search(text)
+    if m is None:
+        return Parsed(preamble=text, error="no JSON document")
+    preamble, body = text[:m.start()], text[m.start():]
+    try:  # fast path: one plain document
+        return Parsed([_loads(body)], preamble)
+    except ValueError:
+        pass
+    try:
+        docs, labels, trailer = _documents(body)
+    except ValueError as e:
+        # Hand-edited numbers like "+0.002" are the one repair worth making.
+        repaired = PLUS_NUMBER.sub(r"\1", body)
+        if repaired == body:
+            return Parsed(preamble=preamble, error=str(e))
+        try:
+            docs, labels, trailer = _documents(repaired)
+        except ValueError:
+            return Parsed(preamble=preamble, error=str(e))
+    if labels:
+        labels[0] = preamble.strip()
+    return Parsed(docs, preamble, trailer, None if docs else "no JSON document", labels)
+
+def parse(data):
+    """bytes or str → Parsed."""
+    if isinstance(data, bytes):
+        data = data.decode("utf-8-sig", errors="replace")
+    return parse_text(data)
+
+# ==============================
+# 💾 CACHED LOADS
+# ==============================
+_cache = OrderedDict()
+_lock = threading.Lock()
+
+def load(path, stat=None, data=None):
+    """Parsed file, re-read only when its (mtime, size) changed.
+
+    Callers that already hold the bytes (e.g. to hash them) pass data to skip the read.
+    """
+    stat = stat or os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        hit = _cache.get(key)
+        if hit is not None:
+            _cache.move_to_end(key)
+            return hit
+    if data is None:
+        with open(path, "rb") as f:
+            data = f.read()
+    parsed = parse(data)
+    with _lock:
+        _cache[key] = parsed
+        while len(_cache) > config.LOADER_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+    return parsed
+
+def document(path, default=None):
+    """Shortcut for consumers that want the document or a default, never an exception."""
+    try:
+        parsed = load(path)
+    except OSError:
+        return default
+    return default if parsed.doc is None else parsed.doc
+
+def clear():
+    with _lock:
+        _cache.clear()
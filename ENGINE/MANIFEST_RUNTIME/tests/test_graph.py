@@ -0,0 +1,43 @@
+# =========================================================
+# tests/test_graph.py
+# =========================================================
+# ✅ Legacy flattened refs against the real tree, and the repair hook from a cold cache
+# =========================================================
+
+import json, os, shutil
+
+from manifest_engine import catalog, config, graph
+
+
+def _graph(root, tmp_path):
+    cat = catalog.Catalog(root, path=str(tmp_path / "cache" / config.CATALOG_FILE)).load()
+    return graph.open_graph(catalog=cat)
+
+def test_flattened_legacy_refs_resolve_in_the_real_tree(tmp_path):
+    g = _graph(config.ROOT, tmp_path)
+    g.catalog.refresh()
+    resolver = graph.Resolver(g.catalog)
+    for ref, target in [("/CORE/FUSION_CELL_LAW.json", "CORE/CORE_FUSION_CELL_LAW.json"),
+                        ("/CORE/CORE_015_META_IS_T9.json", "CORE/CORE_CORE_015_META_IS_T9.json")]:
+        assert resolver.resolve("AUDIT/x.json", ref) == {"ref": ref, "status": "legacy", "target": target}
+
+def test_dot_segments_are_not_external(tmp_path):
+    g = _graph(config.ROOT, tmp_path)
+    g.catalog.refresh()
+    resolver = graph.Resolver(g.catalog)
+    assert resolver.resolve("AUDIT/x.json", "./x/y.json")["status"] == "missing"
+    assert resolver.resolve("AUDIT/x.json", "../AUDIT/x.json")["status"] == "missing"
+    assert resolver.resolve("AUDIT/x.json", "/raw.githubusercontent.com/a/b.json")["status"] == "external"
+
+def test_auto_repair_rewrites_legacy_refs_from_a_cold_cache(tmp_path):
+    root = tmp_path / "tree"
+    (root / "CORE").mkdir(parents=True)
+    shutil.copy(os.path.join(config.ROOT, "CORE", "CORE_FUSION_CELL_LAW.json"), root / "CORE")
+    src = root / "AUDIT" / "report.json"
+    src.parent.mkdir()
+    src.write_text(json.dumps({"law": "/CORE/FUSION_CELL_LAW.json", "guess": "/LAWS/CORE_FUSION_CELL_LAW.json"}))
+
+    fixes = graph.auto_repair_reference("AUDIT/report.json", graph=_graph(str(root), tmp_path), write=True)
+    assert fixes == {"/CORE/FUSION_CELL_LAW.json": "/CORE/CORE_FUSION_CELL_LAW.json"}
+    assert json.loads(src.read_text()) == {"law": "/CORE/CORE_FUSION_CELL_LAW.json",
+                                           "guess": "/LAWS/CORE_FUSION_CELL_LAW.json"}  # fuzzy: not written
@@ -0,0 +1,38 @@
+# ==============================================================
+# 🧪 TOTAL RECALL — DELTA RUNTIME FILES
+# ==============================================================
+
+import json, os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import total_recall_delta as delta_format
+import total_recall_runtime as runtime_format
+
+
+def modules(stamp):
+    return [{"module_id": f"MODULE_{i}", "runtime": {"last_update_utc": stamp}} for i in range(1, 4)]
+
+
+def test_delta_in_the_same_minute_as_its_checkpoint_is_the_latest_state(tmp_path):
+    out = str(tmp_path)
+    path, base = delta_format.plan(out, "US500", "20261017_1200")
+    runtime_format.write(path, modules("first"), {})
+    assert base is None
+
+    path, base = delta_format.plan(out, "US500", "20261017_1200")
+    assert os.path.basename(path) == "TOTAL_RECALL_DELTA_US500_20261017_1200.json"
+    delta_format.write(path, base, iter(modules("second")), {})
+
+    assert [kind for _, kind, _ in delta_format.history(out, "US500")] == ["RUNTIME", "DELTA"]
+    state = delta_format.state_at(out, "US500")
+    assert [m["runtime"]["last_update_utc"] for m in state] == ["second"] * 3
+
+
+def test_legacy_bare_list_checkpoint_as_base(tmp_path):
+    out = str(tmp_path)
+    with open(os.path.join(out, delta_format.file_name(None, "20261017_1100")), "w") as f:
+        json.dump(modules("first"), f)
+    path, base = delta_format.plan(out, None, "20261017_1200")
+    delta_format.write(path, base, iter(modules("second")), {})
+    assert [m["runtime"]["last_update_utc"] for m in delta_format.state_at(out)] == ["second"] * 3
@@ -0,0 +1,200 @@
+# ==============================================================
+# ⚓ TOTAL RECALL — ANCHOR FILES
+# ==============================================================
+# Anchors under TOTAL_RECALL/ANCHOR come in a few shapes:
+#   • module objects back to back ("{...}, {...}") — US100/US500/XRPUSD
+#   • one document with module_N_* keys — ETHUSD/SOLUSD
+#   • one document with derived_modules — EURUSD/USDJPY
+#   • an overlay with no modules at all — US30
+#   • a stray top-level "key": {...} pair between objects — XRPUSD
+# iter_modules() streams every object carrying a module_id out of
+# any of them, reading the file in chunks: memory is bounded by
+# the largest single module, not the file. AnchorWriter writes
+# documents back to back, one at a time, in the same format.
+# ==============================================================
+
+import glob, json, os, re
+
+ANCHOR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ANCHOR")
+SUFFIX = "_TOTAL_RECALL_ANCHOR"
+CHUNK_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_SPACE = re.compile(r'[\s,]*')
+_MODULE_HEAD = re.compile(r'\{\s*"module_id"\s*:')
+CONSUMED = object()  # a subtree whose modules were already yielded
+
+
+class _Reader:
+    """Chunked text source; the buffer only keeps what has not been decoded yet."""
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def more(self):
+        if self.eof:
+            return False
+        # Grow geometrically so a value larger than a chunk is re-decoded O(log n) times.
+        data = self.f.read(max(self.chunk_size, len(self.buf) - self.pos))
+        if not data:
+            self.eof = True
+            return False
+        self.buf += data
+        return True
+
+    def ensure(self, n):
+        while len(self.buf) - self.pos < n and self.more():
+            pass
+
+    def skip(self):
+        """Skip whitespace and the commas between values; the next char or "" at EOF."""
+        if self.pos > self.chunk_size:  # drop what has been decoded
+            self.buf, self.pos = self.buf[self.pos:], 0
+        while True:
+            self.pos = _SPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or not self.more():
+                return self.buf[self.pos:self.pos + 1]
+
+    def expect(self, ch):
+        if self.skip() != ch:
+            raise ValueError(f"expected {ch!r} at …{self.buf[self.pos:self.pos + 40]!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete value with the C decoder, reading more until it fits."""
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except ValueError:
+                if self.more():
+                    continue
+                raise
+            # A number touching the buffer end may continue in the next chunk.
+            if end < len(self.buf) or not self.more():
+                self.pos = end
+                return obj
+
+
+# ==============================================================
+# STREAMING READER
+# ==============================================================
+
+def _stream_value(r):
+    """Yield modules inside the next value; return it, or CONSUMED if it held modules."""
+    c = r.skip()
+    if c == "{":
+        r.ensure(256)
+        if _MODULE_HEAD.match(r.buf, r.pos):
+            yield r.value()  # fast path: a module, parsed in one go
+            return CONSUMED
+        return (yield from _stream_object(r))
+    if c == "[":
+        return (yield from _stream_array(r))
+    return r.value()
+
+
+def _stream_object(r):
+    r.expect("{")
+    obj, consumed = {}, False
+    while r.skip() != "}":
+        key = r.value()
+        r.expect(":")
+        value = yield from _stream_value(r)
+        if value is CONSUMED:
+            consumed = True
+        else:
+            obj[key] = value
+    r.pos += 1
+    if consumed:
+        return CONSUMED
+    if "module_id" in obj:
+        yield obj
+        return CONSUMED
+    return obj
+
+
+def _stream_array(r):
+    r.expect("[")
+    items, consumed = [], False
+    while r.skip() != "]":
+        value = yield from _stream_value(r)
+        if value is CONSUMED:
+            consumed = True
+        else:
+            items.append(value)
+    r.pos += 1
+    return CONSUMED if consumed else items
+
+
+def iter_modules(path):
+    """Yield every module object in the anchor, one at a time, in file order."""
+    with open(path, encoding="utf-8") as f:
+        r = _Reader(f)
+        while r.skip():
+            if r.buf[r.pos] == '"':
+                r.value()  # stray top-level "key": value — stream the value
+                r.expect(":")
+            yield from _stream_value(r)
+
+
+def iter_documents(path):
+    """Yield each top-level document whole (a stray "key": value comes back as {key: value})."""
+    with open(path, encoding="utf-8") as f:
+        r = _Reader(f)
+        while r.skip():
+            if r.buf[r.pos] == '"':
+                key = r.value()
+                r.expect(":")
+                r.skip()
+                yield {key: r.value()}
+            else:
+                yield r.value()
+
+
+def modules(path):
+    return list(iter_modules(path))
+
+
+# ==============================================================
+# INCREMENTAL WRITER
+# ==============================================================
+
+class AnchorWriter:
+    """Write documents back to back ("{...}, {...}"), one at a time, as the US500 anchor is laid out."""
+
+    def __init__(self, path, indent=2):
+        self.path = path
+        self.indent = indent
+        self.count = 0
+        self.f = None
+
+    def __enter__(self):
+        self.f = open(self.path, "w", encoding="utf-8")
+        return self
+
+    def write(self, doc):
+        if self.count:
+            self.f.write(", ")
+        json.dump(doc, self.f, indent=self.indent, ensure_ascii=False)
+        self.count += 1
+
+    def __exit__(self, *exc):
+        self.f.write("\n")
+        self.f.close()
+
+
+# ==============================================================
+# DISCOVERY
+# ==============================================================
+
+def asset_of(path):
+    """"US500_TOTAL_RECALL_ANCHOR_2025-11-06.json" → "US500"."""
+    return os.path.basename(path).split(SUFFIX)[0]
+
+
+def anchor_files(anchor_dir=ANCHOR_DIR):
+    return sorted(glob.glob(os.path.join(anchor_dir, f"*{SUFFIX}*.json")))
@@ -0,0 +1,168 @@
+# ==============================================================
+# 📈 TOTAL RECALL — INCREMENTAL BAR STORE
+# ==============================================================
+# One persistent ring buffer of hourly closes per ticker. Each run
+# only asks the provider for bars newer than the last stored one,
+# and last / Δ% / volatility come from running accumulators that
+# are updated bar by bar instead of recomputed from the full window.
+# The accumulators are never persisted: they are reseeded from the
+# buffer on load and every RESEED_EVERY updates, so drift cannot pile up.
+# ==============================================================
+
+import json, math, os, re, threading, time
+from collections import deque
+
+BAR_DEPTH = int(os.environ.get("TOTAL_RECALL_BAR_DEPTH", "120"))  # 5 trading days of 1h bars
+VOL_WINDOW = 10  # bars in the stdev/mean volatility
+REFRESH_SECONDS = 600  # skip the network entirely when the store is this fresh
+RESEED_EVERY = VOL_WINDOW  # add/remove updates between exact recomputes of the window
+
+
+class RollingStats:
+    """Welford mean/variance over a sliding window: add the newest value, remove the oldest."""
+
+    def __init__(self, n=0, mean=0.0, m2=0.0):
+        self.n, self.mean, self.m2 = n, mean, m2
+
+    @classmethod
+    def of(cls, values):
+        """Exact two-pass stats for values (the reseed the running updates drift from)."""
+        values = list(values)
+        n = len(values)
+        mean = sum(values) / n if n else 0.0
+        return cls(n, mean, sum((x - mean) ** 2 for x in values))
+
+    def add(self, x):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    def remove(self, x):
+        if self.n <= 1:
+            self.n, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        old_mean = self.mean
+        self.mean = (self.n * old_mean - x) / (self.n - 1)
+        self.m2 -= (x - old_mean) * (x - self.mean)
+        self.n -= 1
+
+    def stdev(self):
+        return math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+
+class TickerBars:
+    """Ring buffer of (timestamp, close) plus the running volatility window."""
+
+    def __init__(self, ticker, depth=BAR_DEPTH):
+        self.ticker = ticker
+        self.t = deque(maxlen=max(depth, VOL_WINDOW))
+        self.close = deque(maxlen=max(depth, VOL_WINDOW))
+        self.stats = RollingStats()
+        self.updates = 0
+        self.fetched_at = 0.0
+
+    def reseed(self):
+        self.stats = RollingStats.of(list(self.close)[-VOL_WINDOW:])
+        self.updates = 0
+
+    def _updated(self):
+        self.updates += 1
+        if self.updates >= RESEED_EVERY or self.stats.m2 < 0:
+            self.reseed()
+
+    def push(self, t, close):
+        if self.t and t < self.t[-1]:
+            return  # already have newer bars
+        if self.t and t == self.t[-1]:
+            # The provider re-sends the still-forming bar: swap its close.
+            self.stats.remove(self.close[-1])
+            self.close[-1] = close
+            self.stats.add(close)
+            self._updated()
+            return
+        if len(self.close) >= VOL_WINDOW:
+            self.stats.remove(self.close[-VOL_WINDOW])
+        self.t.append(t)
+        self.close.append(close)
+        self.stats.add(close)
+        self._updated()
+
+    def extend(self, series):
+        for t, close in zip(series.get("t", []), series.get("close", [])):
+            if close is not None:
+                self.push(int(t), close)
+
+    def last_timestamp(self):
+        return self.t[-1] if self.t else None
+
+    def series(self):
+        return {"t": list(self.t), "close": list(self.close)}
+
+    def metrics(self):
+        """(last, Δ%, volatility %) — the same figures price_metrics derives from a full series."""
+        if len(self.close) < 3:
+            return None, None, None
+        last, prev = self.close[-1], self.close[-2]
+        change = ((last - prev) / prev) * 100
+        vol = (self.stats.stdev() / self.stats.mean) * 100 if self.stats.mean else 0.0
+        return round(last, 2), round(change, 2), round(vol, 2)
+
+    # ==============================================================
+    # PERSISTENCE
+    # ==============================================================
+
+    def to_dict(self):
+        return {"ticker": self.ticker, "t": list(self.t), "close": list(self.close), "fetched_at": self.fetched_at}
+
+    @classmethod
+    def from_dict(cls, data, depth=BAR_DEPTH):
+        bars = cls(data["ticker"], depth)
+        bars.t.extend(data["t"])
+        bars.close.extend(data["close"])
+        bars.fetched_at = data.get("fetched_at", 0.0)
+        bars.reseed()
+        return bars
+
+
+class BarStore:
+    """Directory of <ticker>.json ring buffers."""
+
+    def __init__(self, root, depth=BAR_DEPTH):
+        self.root = root
+        self.depth = depth
+        self.locks = {}
+        self.guard = threading.Lock()
+
+    def path(self, ticker):
+        return os.path.join(self.root, re.sub(r"[^A-Za-z0-9]+", "_", ticker).strip("_") + ".json")
+
+    def load(self, ticker):
+        try:
+            with open(self.path(ticker), encoding="utf-8") as f:
+                return TickerBars.from_dict(json.load(f), self.depth)
+        except (OSError, ValueError, KeyError):
+            return TickerBars(ticker, self.depth)
+
+    def save(self, bars):
+        os.makedirs(self.root, exist_ok=True)
+        path = self.path(bars.ticker)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(bars.to_dict(), f)
+        os.replace(tmp, path)
+
+    def update(self, ticker, fetch, refresh=REFRESH_SECONDS):
+        """Load, append whatever fetch(since) returns past the last stored bar, save.
+
+        fetch(None) is a full backfill; fetch(ts) only needs bars from ts on.
+        """
+        with self.guard:
+            lock = self.locks.setdefault(ticker, threading.Lock())
+        with lock:
+            bars = self.load(ticker)
+            if bars.last_timestamp() is None or time.time() - bars.fetched_at >= refresh:
+                bars.extend(fetch(bars.last_timestamp()))
+                bars.fetched_at = time.time()
+                self.save(bars)
+            return bars
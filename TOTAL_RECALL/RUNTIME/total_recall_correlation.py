@@ -0,0 +1,236 @@
+# ==============================================================
+# 🔗 TOTAL RECALL — CROSS-ASSET CORRELATION ENGINE
+# ==============================================================
+# Aligns every ticker on one timestamp index and computes the full
+# N×N Pearson matrix (and rolling windows) in one vectorized pass.
+# Each pair is windowed over its own last N overlapping bars, so 24/7
+# crypto and session-bound equities can sit in the same matrix; a pair
+# with fewer than MIN_PERIODS of them is None, not 0.
+# Falls back to plain Python when NumPy is not available.
+# ==============================================================
+
+import math
+
+try:
+    import numpy as np
+    np.corrcoef  # the Pythonista shim has no array math
+except (ImportError, AttributeError):
+    np = None
+
+MIN_PERIODS = 3
+BLOCK_CELLS = 1 << 20  # rows × pairs per block of temporaries
+RESOLUTION = 3600  # seconds; closes are bucketed to the bar they belong to
+
+
+# ==============================================================
+# ALIGNMENT
+# ==============================================================
+
+def align(series, resolution=RESOLUTION):
+    """{name: {"t": [...], "close": [...]}} → (names, index, rows).
+
+    index is the sorted union of bucketed timestamps; rows[i][j] is the
+    close of names[j] at index[i], or None when that ticker has no bar.
+    """
+    names = [n for n, s in series.items() if s and s.get("t")]
+    columns = {}
+    for name in names:
+        s = series[name]
+        columns[name] = {int(t) // resolution * resolution: c for t, c in zip(s["t"], s["close"]) if c is not None}
+    index = sorted(set().union(*columns.values())) if columns else []
+    rows = [[columns[n].get(t) for n in names] for t in index]
+    return names, index, rows
+
+
+def to_array(rows, width):
+    """rows → centred float T×N array with NaN for gaps (NumPy only)."""
+    if not rows:
+        return np.empty((0, width))
+    x = np.array([[np.nan if v is None else v for v in row] for row in rows], dtype=float)
+    # Centre each column first: Pearson is shift-invariant and the running
+    # sums below stay small, so BTC-sized prices do not cancel out.
+    present = ~np.isnan(x)
+    means = np.where(present, x, 0.0).sum(axis=0) / np.maximum(present.sum(axis=0), 1)
+    return x - means
+
+
+# ==============================================================
+# PAIRWISE-COMPLETE PEARSON
+# ==============================================================
+
+def _finish(n, sx, sxx, sxy):
+    """N×N Pearson r from pairwise sums (sx[i, j] = Σ x_i over the pair's rows); NaN = too few."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = sxy - sx * sx.T / n
+        spread = sxx - sx * sx / n
+        r = cov / np.sqrt(spread * spread.T)
+    r[(n < MIN_PERIODS) | ~np.isfinite(r)] = np.nan
+    np.fill_diagonal(r, 1.0)
+    return np.clip(r, -1.0, 1.0)
+
+
+def _pearson_np(x, window=None):
+    """N×N matrix (NaN = too few overlapping bars) for a T×N array with NaN gaps.
+
+    Each pair keeps only its last `window` rows where both tickers are present.
+    Rows are taken from the end in blocks of matrix products; only the pairs
+    whose window ends inside a block are masked row by row, so memory stays
+    O(N²) per block however many tickers and rows there are.
+    """
+    m = (~np.isnan(x)).astype(float)
+    x0 = np.where(m > 0, x, 0.0)
+    if not window:
+        return _finish(m.T @ m, x0.T @ m, (x0 * x0).T @ m, x0.T @ x0)
+    width = x.shape[1]
+    n, sx, sxx, sxy = (np.zeros((width, width)) for _ in range(4))
+    block = max(1, BLOCK_CELLS // max(width * width, 1))
+    for stop in range(len(x), 0, -block):
+        mb, xb = m[max(0, stop - block):stop], x0[max(0, stop - block):stop]
+        overlap = mb.T @ mb
+        whole = n + overlap <= window          # pairs taking every overlapping row of the block
+        n += np.where(whole, overlap, 0.0)
+        sx += np.where(whole, xb.T @ mb, 0.0)
+        sxx += np.where(whole, (xb * xb).T @ mb, 0.0)
+        sxy += np.where(whole, xb.T @ xb, 0.0)
+        i, j = np.nonzero(~whole & (n < window))
+        if len(i):
+            both = mb[:, i] * mb[:, j]
+            keep = both * (n[i, j] + np.cumsum(both[::-1], axis=0)[::-1] <= window)
+            a, b = xb[:, i] * keep, xb[:, j] * keep
+            n[i, j] += keep.sum(axis=0)
+            sx[i, j] += a.sum(axis=0)
+            sxx[i, j] += (a * xb[:, i]).sum(axis=0)
+            sxy[i, j] += (a * b).sum(axis=0)
+        if (n >= window).all():
+            break
+    return _finish(n, sx, sxx, sxy)
+
+
+def _pearson_py(rows, width, window=None):
+    r = [[1.0 if i == j else None for j in range(width)] for i in range(width)]
+    for i in range(width):
+        for j in range(i + 1, width):
+            pairs = [(row[i], row[j]) for row in rows if row[i] is not None and row[j] is not None]
+            if window:
+                pairs = pairs[-window:]
+            if len(pairs) < MIN_PERIODS:
+                continue
+            n = len(pairs)
+            ma = sum(a for a, _ in pairs) / n
+            mb = sum(b for _, b in pairs) / n
+            num = sum((a - ma) * (b - mb) for a, b in pairs)
+            den = math.sqrt(sum((a - ma) ** 2 for a, _ in pairs) * sum((b - mb) ** 2 for _, b in pairs))
+            r[i][j] = r[j][i] = max(-1.0, min(1.0, num / den)) if den else None
+    return r
+
+
+def _nested(r):
+    """ndarray → nested lists with NaN as None."""
+    return np.where(np.isnan(r), None, r).tolist()
+
+
+def _returns(rows):
+    """Bar-to-bar % change per ticker, against its own previous close."""
+    out, last = [], {}
+    for row in rows:
+        ret = []
+        for j, v in enumerate(row):
+            prev = last.get(j)
+            ret.append((v - prev) / prev if v is not None and prev else None)
+            if v is not None:
+                last[j] = v
+        out.append(ret)
+    return out
+
+
+# ==============================================================
+# PUBLIC API
+# ==============================================================
+
+def correlation_matrix(series, window=20, on="price", resolution=RESOLUTION):
+    """(names, N×N nested list) over each pair's last `window` overlapping bars (None = all).
+
+    A pair with fewer than MIN_PERIODS overlapping bars is None.
+    """
+    names, _, rows = align(series, resolution)
+    if on == "returns":
+        rows = _returns(rows)
+    if np is not None:
+        return names, _nested(_pearson_np(to_array(rows, len(names)), window))
+    return names, _pearson_py(rows, len(names), window)
+
+
+def rolling_correlation(series, window=20, on="price", resolution=RESOLUTION):
+    """(names, index, T'×N×N) — one matrix per aligned bar from the window-th on.
+
+    Each pair in the matrix ending at a bar uses its last `window` overlapping
+    bars up to that bar. With NumPy pairs are taken in column blocks and every
+    window comes out of one set of cumulative sums; nothing is recomputed per
+    window or looped per pair.
+    """
+    names, index, rows = align(series, resolution)
+    if on == "returns":
+        rows = _returns(rows)
+    if len(rows) < window:
+        return names, [], []
+    ends = index[window - 1:]
+    if np is None:
+        return names, ends, [_pearson_py(rows[:k], len(names), window) for k in range(window, len(rows) + 1)]
+
+    x = to_array(rows, len(names))
+    m = ~np.isnan(x)
+    x0 = np.where(m, x, 0.0)
+    width, ends_n = len(names), len(rows) - window + 1
+    r = np.empty((ends_n, width, width))
+    first, second = np.triu_indices(width, 1)
+    step = max(1, BLOCK_CELLS // (len(rows) + 1))
+    for k in range(0, len(first), step):
+        i, j = first[k:k + step], second[k:k + step]
+        r[:, i, j] = r[:, j, i] = _rolling_pairs(m[:, i] & m[:, j], x0[:, i], x0[:, j], window)
+    idx = np.arange(width)
+    r[:, idx, idx] = 1.0
+    return names, ends, _nested(r)
+
+
+def _rolling_pairs(both, a, b, window):
+    """T'×P Pearson r per pair column, each over its last `window` overlapping rows up to every end.
+
+    Window sums are prefix sums minus the prefix at the row where the pair had
+    `window` fewer overlaps; at[k, p] records the row each count was reached.
+    """
+    rows, cols = both.shape
+    a, b = np.where(both, a, 0.0), np.where(both, b, 0.0)
+    count = np.zeros((rows + 1, cols), dtype=np.intp)
+    np.cumsum(both, axis=0, out=count[1:])
+    at = np.zeros((rows + 1) * cols, dtype=np.intp)
+    t, col = np.nonzero(both)
+    at[count[t + 1, col] * cols + col] = t + 1
+    hi = count[window:]
+    col = np.arange(cols)
+    lo = np.take(at, np.maximum(hi - window, 0) * cols + col) * cols + col
+    sums = []
+    for v in (a, b, a * a, b * b, a * b):
+        prefix = np.zeros((rows + 1, cols))
+        np.cumsum(v, axis=0, out=prefix[1:])
+        sums.append(prefix[window:] - np.take(prefix, lo))
+    sa, sb, saa, sbb, sab = sums
+    n = np.minimum(hi, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r = (sab - sa * sb / n) / np.sqrt((saa - sa * sa / n) * (sbb - sb * sb / n))
+    r[(n < MIN_PERIODS) | ~np.isfinite(r)] = np.nan
+    return np.clip(r, -1.0, 1.0)
+
+
+def pairs(names, matrix, base, digits=2):
+    """{"<base>_vs_<name>": r} — one row of the matrix in the legacy output shape (None = too few bars)."""
+    if base not in names:
+        return {}
+    i = names.index(base)
+    return {f"{base}_vs_{n}": None if matrix[i][j] is None else round(matrix[i][j], digits)
+            for j, n in enumerate(names) if n != base}
+
+
+def subset(names, matrix, keep):
+    """(names, matrix) restricted to the tickers in keep, in matrix order."""
+    idx = [i for i, n in enumerate(names) if n in keep]
+    return [names[i] for i in idx], [[matrix[i][j] for j in idx] for i in idx]
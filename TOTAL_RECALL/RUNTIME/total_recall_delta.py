@@ -0,0 +1,172 @@
+# ==============================================================
+# 🧬 TOTAL RECALL — DELTA RUNTIME FILES
+# ==============================================================
+# A propagation run only touches runtime.last_update_utc,
+# telemetry.fusion_integrity, outputs.live_feed and the MODULE_6
+# risk fields, so between checkpoints a run writes just those
+# paths (plus its live feed) against the last full runtime file:
+#   TOTAL_RECALL_RUNTIME_<ASSET>_<stamp>.json   full checkpoint
+#   TOTAL_RECALL_DELTA_<ASSET>_<stamp>.json     changes vs checkpoint
+# Every delta points at its checkpoint, never at another delta, so
+# reconstruct() is one checkpoint load + one patch at any point.
+# ==============================================================
+
+import json, os, re
+import total_recall_anchor as anchor_io
+import total_recall_runtime as runtime_format
+
+FORMAT = "total_recall_delta/1"
+CHECKPOINT_EVERY = int(os.environ.get("TOTAL_RECALL_CHECKPOINT_EVERY", "48"))  # runs per checkpoint: 2 days hourly
+CHECKPOINT_RATIO = 0.5  # a delta this large relative to its checkpoint forces a new one
+
+_NAME = re.compile(r"TOTAL_RECALL_(RUNTIME|DELTA)_(?:(.+)_)?(\d{8}_\d{4})\.json$")
+
+
+def file_name(asset, stamp, kind="RUNTIME"):
+    return f"TOTAL_RECALL_{kind}_{asset}_{stamp}.json" if asset else f"TOTAL_RECALL_{kind}_{stamp}.json"
+
+
+def history(out_dir, asset=None):
+    """[(stamp, kind, path)] of one asset's checkpoints and deltas, oldest first."""
+    if not os.path.isdir(out_dir):
+        return []
+    found = []
+    for name in os.listdir(out_dir):
+        m = _NAME.match(name)
+        if m and m.group(2) == asset:
+            found.append((m.group(3), m.group(1), os.path.join(out_dir, name)))
+    # Within one minute a checkpoint precedes the deltas written against it.
+    return sorted(found, key=lambda f: (f[0], f[1] != "RUNTIME", f[2]))
+
+
+def plan(out_dir, asset, stamp, every=CHECKPOINT_EVERY):
+    """(output path, base checkpoint or None): a delta while the checkpoint is fresh enough.
+
+    Any RUNTIME file can be the checkpoint, envelope or legacy bare list.
+    """
+    base, deltas, last = None, 0, None
+    for _, kind, path in history(out_dir, asset):
+        if kind == "RUNTIME":
+            base, deltas, last = path, 0, None
+        elif base:
+            deltas, last = deltas + 1, path
+    too_big = last and os.path.getsize(last) > CHECKPOINT_RATIO * os.path.getsize(base)
+    if base is None or deltas + 1 >= every or too_big:
+        return os.path.join(out_dir, file_name(asset, stamp)), None
+    return os.path.join(out_dir, file_name(asset, stamp, "DELTA")), base
+
+
+# ==============================================================
+# DIFF / PATCH
+# ==============================================================
+
+def diff(old, new, path=()):
+    """([path, value] to set, [path] to unset) turning dict old into dict new; lists are values."""
+    sets, unsets = [], []
+    for key, value in new.items():
+        if key not in old:
+            sets.append([list(path) + [key], value])
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            s, u = diff(old[key], value, path + (key,))
+            sets += s
+            unsets += u
+        elif value != old[key]:
+            sets.append([list(path) + [key], value])
+    unsets += [list(path) + [key] for key in old if key not in new]
+    return sets, unsets
+
+
+def patch(module, sets, unsets):
+    for path in unsets:
+        node = module
+        for key in path[:-1]:
+            node = node[key]
+        del node[path[-1]]
+    for path, value in sets:
+        node = module
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = value
+    return module
+
+
+# ==============================================================
+# WRITER
+# ==============================================================
+
+def write(path, base, modules, feeds, generated_utc=None):
+    """Diff a stream of modules against base module by module; returns the module count.
+
+    The base checkpoint is streamed alongside, so memory stays at one module
+    pair. A module whose id moved is stored whole.
+    """
+    changes, count = [], 0
+    base_modules = anchor_io.iter_modules(base)
+    for i, mod in enumerate(modules):
+        old = next(base_modules, None)
+        count += 1
+        if old is None or old.get("module_id") != mod.get("module_id"):
+            changes.append({"i": i, "module": mod})
+            continue
+        sets, unsets = diff(old, mod)
+        if sets or unsets:
+            change = {"i": i, "module_id": mod.get("module_id"), "set": sets}
+            if unsets:
+                change["unset"] = unsets
+            changes.append(change)
+    doc = {"format": FORMAT, "base": os.path.basename(base), "generated_utc": generated_utc,
+           runtime_format.FEEDS: feeds, "count": count, "modules": changes}
+    with open(path, "w") as f:
+        json.dump(doc, f, separators=(",", ":"))
+    return count
+
+
+# ==============================================================
+# RECONSTRUCT
+# ==============================================================
+
+def reconstruct(path):
+    """Full Runtime for a delta or checkpoint file (the delta's base is looked up next to it)."""
+    with open(path) as f:
+        doc = json.load(f)
+    if not isinstance(doc, dict) or doc.get("format") != FORMAT:
+        return runtime_format.Runtime(doc)
+    # Through Runtime, so a pre-envelope checkpoint (a bare module list) works as a base too.
+    modules = runtime_format.load(os.path.join(os.path.dirname(path), doc["base"])).raw_modules[:doc["count"]]
+    for change in doc["modules"]:
+        i = change["i"]
+        if "module" not in change:
+            patch(modules[i], change["set"], change.get("unset", []))
+        elif i < len(modules):
+            modules[i] = change["module"]
+        else:
+            modules.append(change["module"])
+    # Every run restamps outputs.live_feed, so the delta's feeds are the whole table.
+    return runtime_format.Runtime(runtime_format.document(modules, doc[runtime_format.FEEDS], doc["generated_utc"]))
+
+
+def state_at(out_dir, asset=None, stamp=None):
+    """Runtime as of stamp (YYYYmmdd_HHMM, default latest) from the newest file not after it."""
+    files = [path for s, _, path in history(out_dir, asset) if stamp is None or s <= stamp]
+    if not files:
+        raise FileNotFoundError(f"no runtime files for {asset or 'default anchor'} in {out_dir}")
+    return reconstruct(files[-1])
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Rebuild a full TOTAL RECALL runtime file from checkpoint + delta")
+    parser.add_argument("out_dir")
+    parser.add_argument("asset", nargs="?", default=None)
+    parser.add_argument("--at", help="YYYYmmdd_HHMM (default: latest)")
+    parser.add_argument("-o", "--output", help="write the full runtime file here (default: stdout summary)")
+    args = parser.parse_args()
+    runtime = state_at(args.out_dir, args.asset, args.at)
+    if args.output:
+        with runtime_format.RuntimeWriter(args.output, runtime.feeds, runtime.generated_utc) as out:
+            for mod in runtime.raw_modules:
+                out.write_module(mod)
+        print(f"✅ {len(runtime)} modules → {args.output}")
+    else:
+        print(f"{runtime.generated_utc} | {len(runtime)} modules | feeds {', '.join(runtime.feeds)}")
@@ -6,8 +6,18 @@
 # TOTAL RECALL modules (1–7)
 # ==============================================================
 
-# --- PYTHONISTA NUMPY PATCH (full compatibility) ---
-import sys, types, random
+# --- NUMPY: real build when present, Pythonista patch only as fallback ---
+import os, sys, types, random
+
+def numpy_available():
+    """True when a real NumPy (with array math) can be imported here."""
+    if os.environ.get("TOTAL_RECALL_NUMPY_SHIM") == "1":
+        return False
+    try:
+        import numpy
+        return callable(getattr(numpy, "asarray", None))
+    except Exception:  # missing, or a broken build on a restricted interpreter
+        return False
 
 class FakeGenerator:
     def random(self, *args):
@@ -41,16 +51,38 @@ fake_numpy = types.SimpleNamespace(
     uint64=int,
     random=FakeRandom()
 )
-sys.modules["numpy"] = fake_numpy
+HAVE_NUMPY = numpy_available()
+if HAVE_NUMPY:
+    import numpy as np
+else:
+    np = None
+    sys.modules["numpy"] = fake_numpy
 # ---------------------------------------------------------------
 
-import requests, json, datetime, math, statistics
-from pytrends.request import TrendReq
+import datetime, math, statistics
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
+
+import total_recall_correlation as correlation_engine
+import total_recall_risk as risk_model
+
+# --- Shared pooled HTTP sessions + response cache (ENGINE/FUSION_RUNTIME/fusion_engine) ---
+RUNTIME_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(RUNTIME_DIR, "..", "..", "ENGINE", "FUSION_RUNTIME"))
+from fusion_engine import cache, config, transport
+from total_recall_bars import BarStore
+import total_recall_sentiment as sentiment_provider
+import total_recall_runtime as runtime_format
+import total_recall_anchor as anchor_io
+import total_recall_delta as delta_format
+from total_recall_anchor import ANCHOR_DIR
+
+bar_store = BarStore(os.environ.get("TOTAL_RECALL_BAR_DIR", os.path.join(config.CACHE_DIR, "bars")))
 
 print("\n🚀 QUANTUM LIVE PROPAGATION v4.0 —", datetime.datetime.utcnow(), "UTC\n")
 
 # --- CONFIGURATION ---
 ANCHOR_FILE = "US500_TOTAL_RECALL_ANCHOR.json"
+FETCH_DEADLINE_SECONDS = 30  # whole fetch phase: tickers + sentiment together
 
 tickers = {
     "SPX": "^GSPC",
@@ -64,41 +96,131 @@ tickers = {
     "ETH": "ETH-USD"
 }
 
+# Asset-specific tickers on top of the shared set above, per anchor.
+ANCHOR_TICKERS = {
+    "US500": {},
+    "US100": {"NDX": "^NDX"},
+    "US30": {},
+    "ETHUSD": {},
+    "SOLUSD": {"SOL": "SOL-USD"},
+    "XRPUSD": {"XRP": "XRP-USD"},
+    "EURUSD": {"EURUSD": "EURUSD=X"},
+    "USDJPY": {"USDJPY": "JPY=X"},
+}
+WRITE_WORKERS = 8
+
+
+def tickers_for(assets):
+    """Shared tickers plus every listed asset's own, each fetched once."""
+    union = dict(tickers)
+    for asset in assets:
+        union.update(ANCHOR_TICKERS.get(asset, {}))
+    return union
+
 
 # ==============================================================
 # PHASE 1 — DATA FETCHERS
 # ==============================================================
 
-def fetch_yahoo_price(ticker):
-    """Fetch last 5d of price data + compute metrics."""
-    url = f"https://query1.finance.yahoo.com/v8/finance/chart/{ticker}?range=5d&interval=1h"
-    r = requests.get(url, timeout=10)
+def fetch_yahoo_series(ticker, since=None):
+    """Fetch hourly closes with their timestamps: last 5d, or only bars from `since` on."""
+    if since is None:
+        url = f"https://query1.finance.yahoo.com/v8/finance/chart/{ticker}?range=5d&interval=1h"
+    else:
+        url = (f"https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
+               f"?period1={int(since)}&period2={int(datetime.datetime.now(datetime.timezone.utc).timestamp()) + 3600}&interval=1h")
+    r = transport.get(url)
     r.raise_for_status()
     data = r.json()["chart"]["result"][0]
-    prices = data["indicators"]["quote"][0]["close"]
-    prices = [p for p in prices if p is not None]
+    closes = data["indicators"]["quote"][0]["close"]
+    stamps = data.get("timestamp") or []
+    bars = [(t, p) for t, p in zip(stamps, closes) if p is not None]
+    return {"t": [t for t, _ in bars], "close": [p for _, p in bars]}
+
+
+def price_metrics(series):
+    """Last price, last Δ% and 10-bar volatility from a close series."""
+    prices = series["close"]
     if len(prices) < 3:
-        return None, None, None, []
+        return None, None, None
     last = prices[-1]
     change = ((prices[-1] - prices[-2]) / prices[-2]) * 100
-    vol = (statistics.stdev(prices[-10:]) / statistics.mean(prices[-10:])) * 100
-    return round(last, 2), round(change, 2), round(vol, 2), prices[-20:]
+    if HAVE_NUMPY:
+        window = np.asarray(prices[-10:], dtype=float)
+        vol = float(window.std(ddof=1) / window.mean()) * 100
+    else:
+        vol = (statistics.stdev(prices[-10:]) / statistics.mean(prices[-10:])) * 100
+    return round(last, 2), round(change, 2), round(vol, 2)
+
+
+def fetch_yahoo_price(ticker):
+    """Fetch last 5d of price data + compute metrics."""
+    series = fetch_yahoo_series(ticker)
+    return (*price_metrics(series), series["close"][-20:])
 
 
 def fetch_sentiment_score():
-    """Google Trends sentiment proxy."""
+    """Google Trends sentiment proxy (cached; see total_recall_sentiment)."""
+    return sentiment_provider.sentiment()[0]
+
+
+def fetch_ticker(ticker):
+    """Top up the ticker's stored bars with only the new ones; (series, metrics)."""
+    bars = bar_store.update(ticker, lambda since: fetch_yahoo_series(ticker, since),
+                            refresh=cache.ttl_for("yahoo_series"))
+    return bars.series(), bars.metrics()
+
+
+def fetch_live_data(deadline=FETCH_DEADLINE_SECONDS, symbols=None):
+    """Fetch every ticker and the sentiment proxy concurrently, under one deadline.
+
+    Results land in live_data as they complete, so wall-clock time is the
+    slowest call rather than the sum; anything still running at the
+    deadline is recorded as a timeout, and a failed or late sentiment call
+    as sentiment_error (the proxy falls back to 50.0).
+    """
+    symbols = symbols or tickers
+    live_data, price_hist = {}, {}
+    pool = ThreadPoolExecutor(max_workers=len(symbols) + 1, thread_name_prefix="propagation-fetch")
+    futures = {pool.submit(fetch_ticker, t): name for name, t in symbols.items()}
+    futures[pool.submit(sentiment_provider.sentiment)] = "sentiment_proxy"
+
+    def store(name, future):
+        if name == "sentiment_proxy":
+            score, source, error = sentiment_provider.FALLBACK_SCORE, "fallback", None
+            try:
+                if not future.done():
+                    raise TimeoutError(f"no response within {deadline}s")
+                score, source, error = future.result()
+            except Exception as e:
+                error = str(e) or type(e).__name__
+            if error:
+                live_data["sentiment_error"] = error
+                print(f"🧠 Sentiment | ⚠️ Error: {error}")
+            live_data[name], live_data["sentiment_source"] = score, source
+            print(f"🧠 Sentiment proxy: {score} ({source})")
+            return
+        try:
+            if not future.done():
+                raise TimeoutError(f"no response within {deadline}s")
+            series, (p, c, v) = future.result()
+            live_data[name] = {"price": p, "change_pct": c, "volatility": v}
+            price_hist[name] = series
+            print(f"{name:<6} | Price: {p:>10} | Δ%: {c:>6} | Vol: {v:>6}")
+        except Exception as e:
+            live_data[name] = {"error": str(e) or type(e).__name__}
+            print(f"{name:<6} | ⚠️ Error: {live_data[name]['error']}")
+
     try:
-        pytrends = TrendReq(hl="en-US", tz=0)
-        kw = ["stocks", "recession", "inflation", "crypto", "fear index"]
-        pytrends.build_payload(kw, timeframe="now 7-d")
-        df = pytrends.interest_over_time()
-        if df.empty:
-            return 50.0
-        score = df.mean().mean()
-        return round(score, 2)
-    except Exception as e:
-        print("⚠️ Sentiment fetch failed:", e)
-        return 50.0
+        for future in as_completed(futures, timeout=deadline):
+            store(futures[future], future)
+    except FuturesTimeout:
+        for future, name in futures.items():
+            if name not in live_data:
+                store(name, future)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return live_data, price_hist
 
 
 # ==============================================================
@@ -106,7 +228,7 @@ def fetch_sentiment_score():
 # ==============================================================
 
 def correlation(a, b):
-    """Manual Pearson correlation."""
+    """Manual Pearson correlation (single pair; run_propagation uses correlation_engine)."""
     if len(a) != len(b) or len(a) < 3:
         return 0
     n = len(a)
@@ -121,101 +243,176 @@ def correlation(a, b):
 
 
 def compute_risk_metrics(data):
-    """Calculate systemic risk score & macro tone."""
-    vix = data.get("VIX", {}).get("price", 20)
-    dxy = data.get("DXY", {}).get("price", 105)
-    us10y = data.get("US10Y", {}).get("price", 4)
-    spx = data.get("SPX", {}).get("change_pct", 0)
-    sentiment = data.get("sentiment_proxy", 50)
-
-    risk_score = min(
-        1,
-        max(0, ((vix - 15) / 15 + (dxy - 100) / 10 - spx / 10 + (100 - sentiment) / 100) / 4),
-    )
-
-    tone = (
-        "risk_on" if risk_score < 0.35 else
-        "neutral" if risk_score < 0.6 else
-        "risk_off"
+    """Calculate systemic risk score & macro tone (total_recall_risk has the batch/streaming forms)."""
+    return risk_model.risk_metrics(
+        vix=(data.get("VIX") or {}).get("price"),
+        dxy=(data.get("DXY") or {}).get("price"),
+        spx_change=(data.get("SPX") or {}).get("change_pct"),
+        sentiment=data.get("sentiment_proxy"),
     )
 
-    return {
-        "vix": vix,
-        "dxy": dxy,
-        "sentiment": sentiment,
-        "risk_score": round(risk_score, 3),
-        "macro_tone_state": tone
-    }
-
 
 # ==============================================================
 # PHASE 3 — PROPAGATION ENGINE
 # ==============================================================
 
-def run_propagation(anchor_file=ANCHOR_FILE):
-    print("📡 Loading anchor:", anchor_file)
-    with open(anchor_file) as f:
-        modules = json.load(f)
+def build_feed(live_data, names, matrix, risk_metrics, symbols):
+    """The live feed for one anchor: its tickers, sentiment, their correlations, risk."""
+    feed = {k: live_data[k] for k in symbols if k in live_data}
+    for k in ("sentiment_proxy", "sentiment_source", "sentiment_error"):
+        if k in live_data:
+            feed[k] = live_data[k]
+    names, matrix = correlation_engine.subset(names, matrix, symbols)
+    feed["correlation_matrix"] = {
+        "tickers": names,
+        "matrix": [[None if r is None else round(r, 2) for r in row] for row in matrix],
+    }
+    if "SPX" in names:
+        feed["correlations"] = correlation_engine.pairs(names, matrix, "SPX")
+    feed["risk_metrics"] = risk_metrics
+    return feed
+
+
+def stamp(mod, fid, risk_metrics, now):
+    """Point one module at the feed and stamp runtime/telemetry; MODULE_6 gets the risk fields."""
+    mod.setdefault("runtime", {})["last_update_utc"] = now
+    mod.setdefault("telemetry", {})["fusion_integrity"] = 0.998
+    mod.setdefault("outputs", {})["live_feed"] = runtime_format.ref(fid)
 
-    live_data = {}
-    price_hist = {}
+    if "MODULE_6" in mod.get("module_id", ""):
+        mod["outputs"]["systemic_risk_score"] = risk_metrics["risk_score"]
+        mod["outputs"]["macro_tone_state"] = risk_metrics["macro_tone_state"]
+    return mod
+
+
+def inject(modules, feed, now):
+    """stamp() every module in a list; returns the {fid: feed} table for the runtime file."""
+    fid = runtime_format.feed_id(feed)
+    for mod in modules:
+        stamp(mod, fid, feed["risk_metrics"], now)
+    return {fid: feed}
 
+
+def propagate_anchor(anchor_file, feed, now, outname, base=None):
+    """Stream one anchor's modules through stamp() into its runtime file; returns outname or None.
+
+    Only one module is in memory at a time, however long the anchor's histories grow.
+    With base (a full runtime file), outname gets only the changes against it.
+    """
+    fid = runtime_format.feed_id(feed)
+    tmp = f"{outname}.tmp"
+    stamped = (stamp(mod, fid, feed["risk_metrics"], now) for mod in anchor_io.iter_modules(anchor_file))
+    try:
+        if base:
+            count = delta_format.write(tmp, base, stamped, {fid: feed}, generated_utc=now)
+        else:
+            with runtime_format.RuntimeWriter(tmp, {fid: feed}, generated_utc=now) as out:
+                for mod in stamped:
+                    out.write_module(mod)
+            count = out.count
+        if count:
+            os.replace(tmp, outname)
+            return outname
+        return None
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def gather(symbols):
+    """One fetch round for symbols: (live_data, names, matrix, risk_metrics)."""
     print("\n📊 Fetching live market data...\n")
-    for name, t in tickers.items():
-        try:
-            p, c, v, hist = fetch_yahoo_price(t)
-            live_data[name] = {"price": p, "change_pct": c, "volatility": v}
-            price_hist[name] = hist
-            print(f"{name:<6} | Price: {p:>10} | Δ%: {c:>6} | Vol: {v:>6}")
-        except Exception as e:
-            live_data[name] = {"error": str(e)}
-            print(f"{name:<6} | ⚠️ Error: {e}")
-
-    # --- Behavioral Polarity (Sentiment Proxy) ---
-    live_data["sentiment_proxy"] = fetch_sentiment_score()
-    print(f"\n🧠 Sentiment proxy: {live_data['sentiment_proxy']}")
-
-    # --- Cross-Asset Correlations ---
-    if "SPX" in price_hist:
-        live_data["correlations"] = {}
-        for k, v in price_hist.items():
-            if k != "SPX":
-                live_data["correlations"][f"SPX_vs_{k}"] = correlation(price_hist["SPX"], v)
+    live_data, price_hist = fetch_live_data(symbols=symbols)
+
+    # --- Cross-Asset Correlations (all tickers on one timestamp index) ---
+    ordered = {k: price_hist[k] for k in symbols if k in price_hist}
+    names, matrix = correlation_engine.correlation_matrix(ordered, window=20)
+    if "SPX" in names:
         print("\n🔗 Cross-asset correlations (SPX):")
-        for pair, val in live_data["correlations"].items():
+        for pair, val in correlation_engine.pairs(names, matrix, "SPX").items():
             print(f"  {pair:<15}: {val}")
 
     # --- Risk Metrics ---
     risk_metrics = compute_risk_metrics(live_data)
-    live_data["risk_metrics"] = risk_metrics
     print("\n⚖️ Risk Metrics:")
     for k, v in risk_metrics.items():
         print(f"  {k:<18}: {v}")
+    return live_data, names, matrix, risk_metrics
+
+
+def output_for(out_dir, asset, stamp, delta):
+    """(path, base): a full runtime file, or in delta mode whatever delta_format.plan() picks."""
+    if delta:
+        return delta_format.plan(out_dir, asset, stamp)
+    return os.path.join(out_dir, delta_format.file_name(asset, stamp)), None
 
-    # --- Inject into Modules ---
-    now = datetime.datetime.utcnow().isoformat() + "Z"
-    for mod in modules:
-        mod.setdefault("runtime", {})["last_update_utc"] = now
-        mod.setdefault("telemetry", {})["fusion_integrity"] = 0.998
-        mod.setdefault("outputs", {})["live_feed"] = live_data
 
-        if "MODULE_6" in mod.get("module_id", ""):
-            mod["outputs"]["systemic_risk_score"] = risk_metrics["risk_score"]
-            mod["outputs"]["macro_tone_state"] = risk_metrics["macro_tone_state"]
+def run_propagation(anchor_file=ANCHOR_FILE, delta=False, out_dir="."):
+    print("📡 Loading anchor:", anchor_file)
+    symbols = tickers_for([anchor_io.asset_of(anchor_file)])
+    live_data, names, matrix, risk_metrics = gather(symbols)
+    feed = build_feed(live_data, names, matrix, risk_metrics, symbols)
 
-    # --- Save Runtime File ---
-    outname = f"TOTAL_RECALL_RUNTIME_{datetime.datetime.utcnow().strftime('%Y%m%d_%H%M')}.json"
-    with open(outname, "w") as f:
-        json.dump(modules, f, indent=2)
+    # --- Inject + Save Runtime File (live feed stored once, modules reference it) ---
+    now = datetime.datetime.utcnow().isoformat() + "Z"
+    outname, base = output_for(out_dir, None, datetime.datetime.utcnow().strftime('%Y%m%d_%H%M'), delta)
+    if not propagate_anchor(anchor_file, feed, now, outname, base):
+        print(f"\n⚠️ No modules found in {anchor_file}")
+        return
 
     print(f"\n✅ Propagation + Risk Calibration complete: {outname}")
     print(f"🕒 Timestamp: {now}")
     print("Ready to upload to the Fusion Engine.\n")
 
 
+def run_batch(anchor_dir=ANCHOR_DIR, out_dir=".", delta=False):
+    """Propagate into every anchor: one fetch round for the union of tickers, parallel writers."""
+    files = anchor_io.anchor_files(anchor_dir)
+    assets = {f: anchor_io.asset_of(f) for f in files}
+    print(f"📡 Batch over {len(files)} anchors: {', '.join(assets.values())}")
+    live_data, names, matrix, risk_metrics = gather(tickers_for(assets.values()))
+
+    now = datetime.datetime.utcnow().isoformat() + "Z"
+    stamp = datetime.datetime.utcnow().strftime('%Y%m%d_%H%M')
+    os.makedirs(out_dir, exist_ok=True)
+    written = {}
+    with ThreadPoolExecutor(max_workers=min(WRITE_WORKERS, len(files) or 1),
+                            thread_name_prefix="propagation-write") as pool:
+        jobs = {}
+        for f, asset in assets.items():
+            feed = build_feed(live_data, names, matrix, risk_metrics, tickers_for([asset]))
+            outname, base = output_for(out_dir, asset, stamp, delta)
+            jobs[pool.submit(propagate_anchor, f, feed, now, outname, base)] = asset
+        for job in as_completed(jobs):
+            asset = jobs[job]
+            try:
+                written[asset] = job.result()
+                print(f"  {asset:<7}| " + (f"✅ {written[asset]}" if written[asset] else "⚠️ no modules, skipped"))
+            except Exception as e:
+                written[asset] = None
+                print(f"  {asset:<7}| ⚠️ Error: {e}")
+
+    print(f"\n✅ Batch propagation complete: {sum(1 for v in written.values() if v)}/{len(files)} anchors")
+    print(f"🕒 Timestamp: {now}\n")
+    return written
+
+
 # ==============================================================
 # MAIN EXECUTION
 # ==============================================================
 
 if __name__ == "__main__":
-    run_propagation()
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Propagate live data into TOTAL RECALL anchors")
+    parser.add_argument("anchor", nargs="?", default=ANCHOR_FILE, help="single anchor file (default: %(default)s)")
+    parser.add_argument("--all", action="store_true", help=f"every anchor in {os.path.normpath(ANCHOR_DIR)}")
+    parser.add_argument("--anchor-dir", default=ANCHOR_DIR)
+    parser.add_argument("--out", default=".", help="output directory")
+    parser.add_argument("--delta", action="store_true",
+                        help=f"write changes against the last checkpoint (full one every {delta_format.CHECKPOINT_EVERY} runs)")
+    args = parser.parse_args()
+    if args.all:
+        run_batch(args.anchor_dir, args.out, args.delta)
+    else:
+        run_propagation(args.anchor, args.delta, args.out)
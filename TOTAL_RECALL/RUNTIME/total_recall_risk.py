@@ -0,0 +1,133 @@
+# ==============================================================
+# ⚖️ TOTAL RECALL — SYSTEMIC RISK MODEL
+# ==============================================================
+# One formula, three ways to run it:
+#   risk_metrics()  latest scalar values (what propagation stamps)
+#   risk_series()   whole aligned histories in one vectorized pass,
+#                   for calibrating the risk_on / risk_off thresholds
+#   RiskStream      bar-by-bar updates, carrying each input forward
+# All three give the same score for the same inputs.
+# ==============================================================
+
+import math
+import total_recall_correlation as correlation_engine
+
+try:
+    import numpy as np
+    np.corrcoef  # the Pythonista shim has no array math
+except (ImportError, AttributeError):
+    np = None
+
+DEFAULTS = {"vix": 20, "dxy": 105, "spx_change": 0, "sentiment": 50}
+RISK_ON, RISK_OFF = 0.35, 0.6  # score < RISK_ON → risk_on, < RISK_OFF → neutral, else risk_off
+
+
+def _score(vix, dxy, spx_change, sentiment):
+    return min(1, max(0, ((vix - 15) / 15 + (dxy - 100) / 10 - spx_change / 10 + (100 - sentiment) / 100) / 4))
+
+
+def tone(score, risk_on=RISK_ON, risk_off=RISK_OFF):
+    return "risk_on" if score < risk_on else "neutral" if score < risk_off else "risk_off"
+
+
+def risk_metrics(vix=None, dxy=None, spx_change=None, sentiment=None, risk_on=RISK_ON, risk_off=RISK_OFF):
+    """The live risk block; missing inputs take DEFAULTS."""
+    vix = DEFAULTS["vix"] if vix is None else vix
+    dxy = DEFAULTS["dxy"] if dxy is None else dxy
+    spx_change = DEFAULTS["spx_change"] if spx_change is None else spx_change
+    sentiment = DEFAULTS["sentiment"] if sentiment is None else sentiment
+    score = _score(vix, dxy, spx_change, sentiment)
+    return {
+        "vix": vix,
+        "dxy": dxy,
+        "sentiment": sentiment,
+        "risk_score": round(score, 3),
+        "macro_tone_state": tone(score, risk_on, risk_off),
+    }
+
+
+# ==============================================================
+# BATCH
+# ==============================================================
+
+def _is_seq(values):
+    return not isinstance(values, (int, float, type(None)))
+
+
+def _filled_np(values, n, default):
+    """Float array of length n: gaps (None/NaN) carry the last value forward, DEFAULTS before it."""
+    if _is_seq(values):
+        x = np.array([np.nan if v is None else v for v in values], dtype=float)
+    else:
+        x = np.full(n, np.nan if values is None else values, dtype=float)
+    present = ~np.isnan(x)
+    last = np.maximum.accumulate(np.where(present, np.arange(n), -1))
+    return np.where(last >= 0, x[np.maximum(last, 0)], default)
+
+
+def _filled_py(values, n, default):
+    out, last = [], default
+    for v in values if _is_seq(values) else [values] * n:
+        if v is not None and not math.isnan(v):
+            last = v
+        out.append(last)
+    return out
+
+
+def risk_series(vix, dxy, spx_change, sentiment=DEFAULTS["sentiment"],
+                risk_on=RISK_ON, risk_off=RISK_OFF, digits=3):
+    """{"risk_score": [...], "macro_tone_state": [...]} for aligned inputs, in one pass.
+
+    Each input is a sequence over the same bars or a scalar (e.g. one
+    sentiment reading for the whole window); gaps are carried forward.
+    """
+    inputs = {"vix": vix, "dxy": dxy, "spx_change": spx_change, "sentiment": sentiment}
+    n = max((len(v) for v in inputs.values() if _is_seq(v)), default=1)
+    if np is None:
+        cols = [_filled_py(v, n, DEFAULTS[k]) for k, v in inputs.items()]
+        scores = [_score(*bar) for bar in zip(*cols)]
+        return {"risk_score": [round(x, digits) for x in scores],
+                "macro_tone_state": [tone(x, risk_on, risk_off) for x in scores]}
+
+    v, d, s, m = (_filled_np(val, n, DEFAULTS[k]) for k, val in inputs.items())
+    scores = np.clip(((v - 15) / 15 + (d - 100) / 10 - s / 10 + (100 - m) / 100) / 4, 0, 1)
+    tones = np.where(scores < risk_on, "risk_on", np.where(scores < risk_off, "neutral", "risk_off"))
+    return {"risk_score": np.round(scores, digits).tolist(), "macro_tone_state": tones.tolist()}
+
+
+def historical(series, sentiment=DEFAULTS["sentiment"], resolution=correlation_engine.RESOLUTION, **kwargs):
+    """(index, risk_series) from bar histories {"VIX": {"t", "close"}, "DXY": ..., "SPX": ...}.
+
+    SPX change is bar-to-bar % on the aligned SPX closes, as change_pct is live.
+    """
+    names, index, rows = correlation_engine.align(
+        {k: series.get(k) for k in ("VIX", "DXY", "SPX")}, resolution)
+    col = {name: [row[j] for row in rows] for j, name in enumerate(names)}
+    none = [None] * len(rows)
+    spx, prev = [], None
+    for close in col.get("SPX", none):
+        spx.append(((close - prev) / prev) * 100 if close is not None and prev else None)
+        if close is not None:
+            prev = close
+    return index, risk_series(col.get("VIX", none), col.get("DXY", none), spx, sentiment, **kwargs)
+
+
+# ==============================================================
+# STREAMING
+# ==============================================================
+
+class RiskStream:
+    """Feed one bar at a time; inputs not given on a bar keep their last value."""
+
+    def __init__(self, risk_on=RISK_ON, risk_off=RISK_OFF):
+        self.risk_on, self.risk_off = risk_on, risk_off
+        self.last = dict(DEFAULTS)
+        self.counts = {"risk_on": 0, "neutral": 0, "risk_off": 0}  # time in each tone so far
+
+    def update(self, vix=None, dxy=None, spx_change=None, sentiment=None):
+        for key, value in (("vix", vix), ("dxy", dxy), ("spx_change", spx_change), ("sentiment", sentiment)):
+            if value is not None:
+                self.last[key] = value
+        metrics = risk_metrics(risk_on=self.risk_on, risk_off=self.risk_off, **self.last)
+        self.counts[metrics["macro_tone_state"]] += 1
+        return metrics
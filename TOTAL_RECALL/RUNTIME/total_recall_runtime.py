@@ -0,0 +1,170 @@
+# ==============================================================
+# 🗃️ TOTAL RECALL — RUNTIME FILE FORMAT
+# ==============================================================
+# The live feed is written once per runtime file under
+# "live_feeds" and every module points at it with a reference:
+#   "live_feed": {"$ref": "live_feeds/<id>"}
+# so file size and dump time no longer scale with the module
+# count. load() resolves references lazily, on access, and also
+# reads the legacy format (a bare list of modules).
+# ==============================================================
+
+import hashlib, json
+from collections.abc import Mapping
+
+FORMAT = "total_recall_runtime/2"
+FEEDS = "live_feeds"
+
+
+def feed_id(feed):
+    """Content id: identical feeds (e.g. across anchors of one batch) share one entry."""
+    raw = json.dumps(feed, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+
+
+def ref(fid):
+    return {"$ref": f"{FEEDS}/{fid}"}
+
+
+def is_ref(value):
+    return isinstance(value, dict) and len(value) == 1 and "$ref" in value
+
+
+# ==============================================================
+# WRITER
+# ==============================================================
+
+def document(modules, feeds, generated_utc=None):
+    return {"format": FORMAT, "generated_utc": generated_utc, FEEDS: feeds, "modules": modules}
+
+
+def write(path, modules, feeds, generated_utc=None, indent=2):
+    """Write modules (already holding refs) with each feed stored once."""
+    with open(path, "w") as f:
+        json.dump(document(modules, feeds, generated_utc), f, indent=indent)
+
+
+class RuntimeWriter:
+    """Incremental write(): header and feeds first, then modules one at a time.
+
+    Produces the same document as write(), without holding the module list.
+    """
+
+    def __init__(self, path, feeds, generated_utc=None, indent=2):
+        self.path = path
+        self.feeds = feeds
+        self.generated_utc = generated_utc
+        self.indent = indent
+        self.count = 0
+        self.f = None
+
+    def _pad(self, depth):
+        return "\n" + " " * self.indent * depth if self.indent else ""
+
+    def _dump(self, value, depth):
+        return json.dumps(value, indent=self.indent).replace("\n", self._pad(depth))
+
+    def __enter__(self):
+        sep = "," if self.indent else ", "
+        head = document(None, self.feeds, self.generated_utc)
+        del head["modules"]
+        self.f = open(self.path, "w")
+        self.f.write("{")
+        for key, value in head.items():
+            self.f.write(f"{self._pad(1)}{json.dumps(key)}: {self._dump(value, 1)}{sep}")
+        self.f.write(f'{self._pad(1)}"modules": [')
+        return self
+
+    def write_module(self, module):
+        sep = ("," if self.indent else ", ") if self.count else ""
+        self.f.write(sep + self._pad(2) + self._dump(module, 2))
+        self.count += 1
+
+    def __exit__(self, *exc):
+        self.f.write((self._pad(1) if self.count else "") + "]" + self._pad(0) + "}")
+        self.f.close()
+
+
+# ==============================================================
+# READER
+# ==============================================================
+
+class LazyModule(Mapping):
+    """Read-only view of a module; {"$ref"} values resolve when accessed."""
+
+    def __init__(self, raw, runtime):
+        self._raw = raw
+        self._runtime = runtime
+
+    def __getitem__(self, key):
+        return self._runtime.resolve(self._raw[key])
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __repr__(self):
+        return f"LazyModule({self._raw.get('module_id') or list(self._raw)!r})"
+
+    def to_dict(self):
+        """Plain dict with every reference expanded (feeds shared, not copied)."""
+        return self._runtime.materialize(self._raw)
+
+
+class Runtime:
+    """A loaded runtime file: iterate it for modules, or use .feed(id)."""
+
+    def __init__(self, doc):
+        if isinstance(doc, list):  # legacy: feed copied into every module
+            doc = {"format": "total_recall_runtime/1", FEEDS: {}, "modules": doc}
+        self.format = doc.get("format")
+        self.generated_utc = doc.get("generated_utc")
+        self.feeds = doc.get(FEEDS, {})
+        self.raw_modules = doc.get("modules", [])
+
+    def feed(self, fid):
+        return self.feeds[fid]
+
+    def resolve(self, value):
+        if is_ref(value):
+            section, _, fid = value["$ref"].partition("/")
+            if section != FEEDS or fid not in self.feeds:
+                raise KeyError(f"dangling reference {value['$ref']}")
+            return self.feeds[fid]
+        if isinstance(value, dict):
+            return LazyModule(value, self)
+        if isinstance(value, list):
+            return [self.resolve(v) for v in value]
+        return value
+
+    def materialize(self, value):
+        if is_ref(value):
+            return self.resolve(value)
+        if isinstance(value, dict):
+            return {k: self.materialize(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.materialize(v) for v in value]
+        return value
+
+    def __iter__(self):
+        return (LazyModule(m, self) for m in self.raw_modules)
+
+    def __len__(self):
+        return len(self.raw_modules)
+
+    def __getitem__(self, i):
+        return LazyModule(self.raw_modules[i], self)
+
+    def module(self, module_id):
+        """First module whose module_id contains module_id (e.g. "MODULE_6")."""
+        for m in self.raw_modules:
+            if module_id in m.get("module_id", ""):
+                return LazyModule(m, self)
+        raise KeyError(module_id)
+
+
+def load(path):
+    with open(path) as f:
+        return Runtime(json.load(f))
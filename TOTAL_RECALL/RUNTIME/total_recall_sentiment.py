@@ -0,0 +1,87 @@
+# ==============================================================
+# 🧠 TOTAL RECALL — GOOGLE TRENDS SENTIMENT PROVIDER
+# ==============================================================
+# Trends data moves slowly and throttles hard, so the score is
+# cached on disk (shared fusion_engine cache) per keyword set +
+# timeframe, live calls are spaced out (across runs: the last call
+# time lives in the same cache) and backed off after a 429, and pytrends (with its pandas import chain) is only
+# imported when a live fetch actually happens.
+# Every score is reported with its source: cache | fresh | fallback,
+# and with the error when a live fetch failed.
+# ==============================================================
+
+import os, sys, time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "ENGINE", "FUSION_RUNTIME"))
+from fusion_engine import cache, config, replay
+
+KEYWORDS = ["stocks", "recession", "inflation", "crypto", "fear index"]
+TIMEFRAME = "now 7-d"
+FALLBACK_SCORE = 50.0
+
+TTL_SECONDS = int(os.environ.get("TOTAL_RECALL_SENTIMENT_TTL", str(6 * 3600)))
+MIN_INTERVAL_SECONDS = int(os.environ.get("TOTAL_RECALL_SENTIMENT_INTERVAL", "60"))  # between live calls; 0 = no limit
+BACKOFF_SECONDS = 3600  # after Google answers 429
+
+PROVIDER = "pytrends"
+
+
+def cache_key(keywords=KEYWORDS, timeframe=TIMEFRAME):
+    return f"{timeframe}|{','.join(sorted(k.lower() for k in keywords))}"
+
+
+def fetch_trends(keywords=KEYWORDS, timeframe=TIMEFRAME):
+    """Live Google Trends mean interest; the only place pytrends is imported."""
+    from pytrends.request import TrendReq
+
+    pytrends = TrendReq(hl="en-US", tz=0)
+    pytrends.build_payload(list(keywords), timeframe=timeframe)
+    df = pytrends.interest_over_time()
+    if df.empty:
+        raise ValueError(f"Google Trends returned no data for {timeframe}")
+    return round(float(df.mean().mean()), 2)
+
+
+def _throttled(key):
+    entry = cache.read_entry(PROVIDER, f"backoff|{key}")
+    return bool(entry) and entry["value"] > time.time()
+
+
+def _back_off(key):
+    cache.write_entry(PROVIDER, f"backoff|{key}", time.time() + BACKOFF_SECONDS)
+
+
+def _too_soon():
+    entry = cache.read_entry(PROVIDER, "last_call")
+    return bool(entry) and time.time() - entry["value"] < MIN_INTERVAL_SECONDS
+
+
+def _called():
+    cache.write_entry(PROVIDER, "last_call", time.time())
+
+
+def sentiment(keywords=KEYWORDS, timeframe=TIMEFRAME, ttl=TTL_SECONDS):
+    """(score, source, error) — source is "cache", "fresh" or "fallback"; error is why a live fetch failed."""
+    key = cache_key(keywords, timeframe)
+    entry = cache.read_entry(PROVIDER, key) if config.CACHE_ENABLED else None
+    if entry and time.time() - entry["stored_at"] < ttl:
+        return entry["value"], "cache", None
+
+    # Anything stale beats the neutral constant when we cannot go live.
+    fallback = entry["value"] if entry else FALLBACK_SCORE
+    if _throttled(key) or _too_soon() or not cache.acquire(PROVIDER, key):
+        return fallback, "fallback", None
+    try:
+        _called()
+        # pytrends keeps its own HTTP session, so it is recorded/replayed by value.
+        score = replay.value(PROVIDER, ",".join(keywords), lambda: fetch_trends(keywords, timeframe))
+    except Exception as e:
+        if "429" in str(e) or type(e).__name__ == "TooManyRequestsError":
+            _back_off(key)
+        print("⚠️ Sentiment fetch failed:", e)
+        return fallback, "fallback", str(e) or type(e).__name__
+    finally:
+        cache.release(PROVIDER, key)
+    if config.CACHE_ENABLED:
+        cache.write_entry(PROVIDER, key, score)
+    return score, "fresh", None